@@ -8,6 +8,11 @@ Creates two hosts, establishes a real connection, and runs privacy analysis
 on the captured metadata.
 """
 
+import argparse
+import sys
+from contextlib import asynccontextmanager
+from typing import List, NamedTuple, Optional
+
 import trio
 from libp2p import new_host
 from libp2p.peer.peerinfo import info_from_p2p_addr
@@ -25,171 +30,254 @@ LISTEN_TIMEOUT = 10  # Time to bind listener
 CONNECT_TIMEOUT = 10  # Time to establish connection
 CLOSE_TIMEOUT = 5    # Time to cleanup/close hosts
 
+# (label, statistics key) pairs shown in the final summary
+FINAL_STATISTICS = (
+    ("Total connections", "total_connections"),
+    ("Active connections", "active_connections"),
+    ("Unique peers", "unique_peers"),
+    ("Protocols seen", "protocols_used"),
+)
+
+
+def _flush(out_lines: List[str]) -> None:
+    """Emit buffered output lines with a single stdout write."""
+    if out_lines:
+        sys.stdout.write("\n".join(out_lines) + "\n")
+        sys.stdout.flush()
+        out_lines.clear()
+
+
+class HostPair(NamedTuple):
+    """Two connected hosts plus the collector attached to the first one."""
+    host1: object
+    host2: object
+    collector: MetadataCollector
+
+
+@asynccontextmanager
+async def host_pair_pool():
+    """
+    Create, start and connect a pair of hosts once.
+
+    The yielded HostPair can be passed to main() repeatedly so that listener
+    setup and the libp2p handshake are paid only once; the hosts are closed
+    when the context exits.
+    """
+    out_lines: List[str] = []
 
-async def main():
-    """Run the basic privacy analysis example with real connections."""
-    
-    print("\n" + "=" * 70)
-    print("libp2p Privacy Analysis Tool - Basic Example")
-    print("=" * 70)
-    print("\nUsing REAL py-libp2p connections with automatic event capture\n")
-    
     # Create two hosts
-    print("1. Creating two libp2p hosts...")
+    out_lines.append("1. Creating two libp2p hosts...")
     listen_addr1 = Multiaddr("/ip4/127.0.0.1/tcp/0")
     listen_addr2 = Multiaddr("/ip4/127.0.0.1/tcp/0")
     
     host1 = new_host()
     host2 = new_host()
-    print(f"   Host1 ID: {host1.get_id()}")
-    print(f"   Host2 ID: {host2.get_id()}")
+    out_lines.append(f"   Host1 ID: {host1.get_id()}")
+    out_lines.append(f"   Host2 ID: {host2.get_id()}")
     
     # Attach MetadataCollector to host1
-    print("\n2. Creating MetadataCollector with automatic event capture...")
+    out_lines.append("\n2. Creating MetadataCollector with automatic event capture...")
     collector = MetadataCollector(host1)
-    print("   ✓ Collector attached (events will be auto-captured via INotifee)")
+    out_lines.append("   ✓ Collector attached (events will be auto-captured via INotifee)")
     
     # Start networks using background_trio_service
-    print("\n3. Starting networks...")
+    out_lines.append("\n3. Starting networks...")
     network1 = host1.get_network()
     network2 = host2.get_network()
     
     async with background_trio_service(network1):
         async with background_trio_service(network2):
-            print("   ✓ Networks started")
+            out_lines.append("   ✓ Networks started")
             
             # Start listeners (with timeout protection)
-            print("\n4. Starting listeners...")
+            out_lines.append("\n4. Starting listeners...")
             with trio.fail_after(LISTEN_TIMEOUT):
                 await network1.listen(listen_addr1)
                 await network2.listen(listen_addr2)
-            
-            # Wait for listeners to be ready
-            await trio.sleep(0.5)
+                # Wait only until the listener is registered
+                while not network2.listeners:
+                    await trio.sleep(0.01)
             
             # Get actual listening address using utility function
             full_addr = get_peer_listening_address(host2)
-            print(f"   ✓ Host2 listening on: {full_addr}")
+            out_lines.append(f"   ✓ Host2 listening on: {full_addr}")
             
             # Establish connection from host1 to host2 (with timeout protection)
-            print("\n5. Establishing real connection...")
+            out_lines.append("\n5. Establishing real connection...")
             peer_info = info_from_p2p_addr(full_addr)
             with trio.fail_after(CONNECT_TIMEOUT):
                 await host1.connect(peer_info)
-            print("   ✓ Connection established!")
-            
-            # Wait for events to be captured
-            await trio.sleep(0.5)
-            
-            # Check captured events
-            stats = collector.get_statistics()
-            print(f"\n6. Events captured by MetadataCollector:")
-            print(f"   Total connections: {stats['total_connections']}")
-            print(f"   Active connections: {stats['active_connections']}")
-            print(f"   Unique peers: {stats['unique_peers']}")
-            
-            if stats['total_connections'] == 0:
-                print("\n   ⚠️  Warning: No events captured. This is unexpected.")
-                print("   The INotifee should have captured the connection automatically.")
-            else:
-                print("\n   ✓ Real connection events captured successfully!")
-    
-            # Run privacy analysis
-            print("\n7. Running Privacy Analysis...")
-            analyzer = PrivacyAnalyzer(collector)
-            report = analyzer.analyze()
-            
-            print(f"\n   Analysis Complete!")
-            print(f"   - Overall Risk Score: {report.overall_risk_score:.2f}/1.00")
-            print(f"   - Risks Detected: {len(report.risks)}")
-            print(f"   - Critical Risks: {len(report.get_critical_risks())}")
-            print(f"   - High Risks: {len(report.get_high_risks())}")
-            
-            # Display summary
-            print("\n" + "=" * 70)
-            print("Privacy Analysis Summary")
-            print("=" * 70)
-            print(report.summary())
-            
-            # Generate ZK proofs (mock)
-            print("\n" + "=" * 70)
-            print("Generating Mock ZK Proofs")
-            print("=" * 70)
-            
-            zk_system = MockZKProofSystem()
-            
-            # Generate anonymity set proof
-            print("\n8. Generating anonymity set proof...")
-            peer_ids = list(collector.peers.keys())
-            if peer_ids:
-                anonymity_proof = zk_system.generate_anonymity_set_proof(
-                    peer_id=str(peer_ids[0]),
-                    anonymity_set_size=len(peer_ids)
-                )
-                print(f"   ✓ Proof generated")
-                print(f"   Type: {anonymity_proof.proof_type}")
-                print(f"   Claim: Peer is one of {len(peer_ids)} peers")
-                
-                # Verify proof
-                is_valid = zk_system.verify_proof(anonymity_proof)
-                print(f"   Verification: {'✓ Valid' if is_valid else '✗ Invalid'}")
-            
-            # Generate enhanced report with ZK proofs
-            print("\n9. Generating reports...")
-            
-            # Generate proofs for the report (as dictionary)
-            zk_proofs = {}
-            if peer_ids:
-                anonymity_proof = zk_system.generate_anonymity_set_proof(
-                    peer_id=str(peer_ids[0]),
-                    anonymity_set_size=len(peer_ids)
-                )
-                zk_proofs["anonymity_set"] = [anonymity_proof]
-            
-            # Generate reports in different formats
-            report_gen = ReportGenerator()
-            
-            # Console report
-            print("\n   Generating console report...")
-            console_report = report_gen.generate_console_report(report, zk_proofs)
-            
-            # JSON report
-            print("   Generating JSON report...")
-            json_report = report_gen.generate_json_report(report, zk_proofs)
-            
-            # HTML report  
-            print("   Generating HTML report...")
-            html_report = report_gen.generate_html_report(report, zk_proofs)
-            
-            print(f"\n   ✓ All reports generated successfully")
-            
-            # Export statistics
-            print("\n10. Final statistics...")
-            stats = collector.get_statistics()
-            print(f"\n    Network Statistics:")
-            print(f"    - Total connections: {stats['total_connections']}")
-            print(f"    - Active connections: {stats['active_connections']}")
-            print(f"    - Unique peers: {stats['unique_peers']}")
-            print(f"    - Protocols seen: {stats['protocols_used']}")
-            
-            print("\n" + "=" * 70)
-            print("✓ Analysis Complete!")
-            print("=" * 70)
-            
-            print("\n💡 Key Achievement:")
-            print("   - Real py-libp2p connections established and analyzed")
-            print("   - Events automatically captured via INotifee")
-            print("   - Privacy analysis performed on real network metadata")
-            print("   - Ready for production integration!\n")
-            
-            # Cleanup (with timeout protection)
-            print("11. Cleaning up...")
-            with trio.fail_after(CLOSE_TIMEOUT):
-                await host1.close()
-                await host2.close()
-            print("    ✓ Hosts closed")
+                # Wait for the notifee to capture the connection event
+                await collector.connection_event.wait()
+            out_lines.append("   ✓ Connection established!")
+            _flush(out_lines)
+
+            try:
+                yield HostPair(host1, host2, collector)
+            finally:
+                # Cleanup (with timeout protection)
+                out_lines.append("11. Cleaning up...")
+                with trio.fail_after(CLOSE_TIMEOUT):
+                    await host1.close()
+                    await host2.close()
+                out_lines.append("    ✓ Hosts closed")
+                _flush(out_lines)
+
+
+async def main(parallel: bool = True, pair: Optional[HostPair] = None):
+    """
+    Run the basic privacy analysis example with real connections.
+
+    Args:
+        parallel: Render the report formats concurrently on worker threads
+        pair: Already-connected hosts from host_pair_pool(); when omitted a
+            fresh pair is created and closed for this run
+    """
+    
+    out_lines: List[str] = []
+    out_lines.append("\n" + "=" * 70)
+    out_lines.append("libp2p Privacy Analysis Tool - Basic Example")
+    out_lines.append("=" * 70)
+    out_lines.append("\nUsing REAL py-libp2p connections with automatic event capture\n")
+    _flush(out_lines)
+
+    if pair is None:
+        async with host_pair_pool() as pair:
+            await _analyze(pair, parallel)
+    else:
+        await _analyze(pair, parallel)
+
+
+async def _analyze(pair: HostPair, parallel: bool):
+    """Run steps 6-10 against an already-connected host pair."""
+    collector = pair.collector
+    out_lines: List[str] = []
+
+    # Check captured events
+    stats = collector.get_statistics()
+    out_lines.append(f"\n6. Events captured by MetadataCollector:")
+    out_lines.append(f"   Total connections: {stats['total_connections']}")
+    out_lines.append(f"   Active connections: {stats['active_connections']}")
+    out_lines.append(f"   Unique peers: {stats['unique_peers']}")
+    
+    if stats['total_connections'] == 0:
+        out_lines.append("\n   ⚠️  Warning: No events captured. This is unexpected.")
+        out_lines.append("   The INotifee should have captured the connection automatically.")
+    else:
+        out_lines.append("\n   ✓ Real connection events captured successfully!")
+    _flush(out_lines)
+
+    # Run privacy analysis
+    out_lines.append("\n7. Running Privacy Analysis...")
+    analyzer = PrivacyAnalyzer(collector)
+    report = analyzer.analyze()
+    
+    out_lines.append(f"\n   Analysis Complete!")
+    out_lines.append(f"   - Overall Risk Score: {report.overall_risk_score:.2f}/1.00")
+    out_lines.append(f"   - Risks Detected: {len(report.risks)}")
+    out_lines.append(f"   - Critical Risks: {len(report.get_critical_risks())}")
+    out_lines.append(f"   - High Risks: {len(report.get_high_risks())}")
+    
+    # Display summary
+    out_lines.append("\n" + "=" * 70)
+    out_lines.append("Privacy Analysis Summary")
+    out_lines.append("=" * 70)
+    out_lines.append(report.summary())
+    
+    # Generate ZK proofs (mock)
+    out_lines.append("\n" + "=" * 70)
+    out_lines.append("Generating Mock ZK Proofs")
+    out_lines.append("=" * 70)
+    
+    zk_system = MockZKProofSystem()
+    
+    # Generate anonymity set proof
+    out_lines.append("\n8. Generating anonymity set proof...")
+    peer_count = len(collector.peers)
+    first_peer_id = next(iter(collector.peers), None)
+    anonymity_proof = None
+    if first_peer_id is not None:
+        anonymity_proof = zk_system.generate_anonymity_set_proof(
+            peer_id=str(first_peer_id),
+            anonymity_set_size=peer_count
+        )
+        out_lines.append(f"   ✓ Proof generated")
+        out_lines.append(f"   Type: {anonymity_proof.proof_type}")
+        out_lines.append(f"   Claim: Peer is one of {peer_count} peers")
+        
+        # Verify proof
+        is_valid = zk_system.verify_proof(anonymity_proof)
+        out_lines.append(f"   Verification: {'✓ Valid' if is_valid else '✗ Invalid'}")
+    
+    # Generate enhanced report with ZK proofs
+    out_lines.append("\n9. Generating reports...")
+    
+    # Reuse the step 8 proof for the report (as dictionary)
+    zk_proofs = {"anonymity_set": [anonymity_proof]} if anonymity_proof else {}
+    
+    # Generate reports in all formats (console, JSON, HTML)
+    report_gen = ReportGenerator()
+    out_lines.append("\n   Generating console, JSON and HTML reports...")
+    renderers = {
+        "console": report_gen.generate_console_report,
+        "json": report_gen.generate_json_report,
+        "html": report_gen.generate_html_report,
+    }
+    reports = {}
+    if parallel:
+        async def render(fmt, renderer):
+            reports[fmt] = await trio.to_thread.run_sync(renderer, report, zk_proofs)
+
+        async with trio.open_nursery() as nursery:
+            for fmt, renderer in renderers.items():
+                nursery.start_soon(render, fmt, renderer)
+    else:
+        for fmt, renderer in renderers.items():
+            reports[fmt] = renderer(report, zk_proofs)
+    
+    out_lines.append(f"\n   ✓ All reports generated successfully ({len(reports)} formats)")
+    
+    # Export statistics (analysis is read-only, so the step 6 snapshot still holds)
+    out_lines.append("\n10. Final statistics...")
+    out_lines.append(f"\n    Network Statistics:")
+    out_lines.extend(
+        f"    - {label}: {stats[key]}" for label, key in FINAL_STATISTICS
+    )
+    
+    out_lines.append("\n" + "=" * 70)
+    out_lines.append("✓ Analysis Complete!")
+    out_lines.append("=" * 70)
+    
+    out_lines.append("\n💡 Key Achievement:")
+    out_lines.append("   - Real py-libp2p connections established and analyzed")
+    out_lines.append("   - Events automatically captured via INotifee")
+    out_lines.append("   - Privacy analysis performed on real network metadata")
+    out_lines.append("   - Ready for production integration!\n")
+    _flush(out_lines)
 
 
 if __name__ == "__main__":
-    trio.run(main)
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Render reports sequentially instead of on worker threads",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1,
+        help="Run the analysis N times, reusing one connected host pair",
+    )
+    args = parser.parse_args()
+
+    async def run():
+        if args.iterations <= 1:
+            await main(not args.no_parallel)
+            return
+        async with host_pair_pool() as pair:
+            for _ in range(args.iterations):
+                await main(not args.no_parallel, pair)
+
+    trio.run(run)
 
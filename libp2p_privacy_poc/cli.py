@@ -4,30 +4,107 @@ Command-Line Interface for Privacy Protocol Toolkit for P2P (py-libp2p)
 Provides easy-to-use commands for privacy analysis, reporting, and demonstrations.
 """
 
+from __future__ import annotations
+
 import click
+import contextlib
+import functools
 import json
 import logging
-import platform
-import subprocess
+import os
 import sys
 import time
-from pathlib import Path
-from typing import Optional
-
-from libp2p import new_host
-from multiaddr import Multiaddr
+import traceback
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from libp2p_privacy_poc import print_disclaimer
-from libp2p_privacy_poc.metadata_collector import MetadataCollector
-from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
-from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem
-from libp2p_privacy_poc.report_generator import ReportGenerator
-from libp2p_privacy_poc.zk_integration import (
-    ZKDataPreparator,
-    generate_real_commitment_proof,
-    generate_real_phase2b_proofs,
-    generate_snark_phase2b_proofs,
+
+# cbor2, subprocess, the privacyzk network layer and the ZK backends are
+# imported inside the commands and helpers that need them, so each command
+# only loads its own dependencies
+if TYPE_CHECKING:
+    from multiaddr import Multiaddr
+
+    from libp2p_privacy_poc.metadata_collector import MetadataCollector
+
+_RULE = "=" * 70
+
+# --zk-backend -> proof flags it turns on:
+# (with_zk_proofs, with_real_phase2b, with_snark_phase2b)
+_ZK_BACKEND_FLAGS = {
+    "mock": (True, False, False),
+    "pedersen": (False, True, False),
+    "snark-membership": (False, False, True),
+    "snark": (False, False, True),
+}
+
+# Proof request nonces are sliced from one CSPRNG draw, so a batch of
+# requests costs one urandom call per 256 nonces
+_NONCE_SIZE = 16
+_NONCE_POOL_SIZE = 4096
+_nonce_pool = b""
+_nonce_offset = 0
+
+
+def _request_nonce() -> bytes:
+    """Return a fresh 16-byte request nonce from the pooled urandom buffer."""
+    global _nonce_pool, _nonce_offset
+    if _nonce_offset + _NONCE_SIZE > len(_nonce_pool):
+        _nonce_pool = os.urandom(_NONCE_POOL_SIZE)
+        _nonce_offset = 0
+    nonce = _nonce_pool[_nonce_offset:_nonce_offset + _NONCE_SIZE]
+    _nonce_offset += _NONCE_SIZE
+    return nonce
+
+
+def _banner(title: str, status: str, color: str) -> str:
+    """Pre-render a command banner so it is written in a single echo."""
+    return "\n".join([
+        "\n" + _RULE,
+        click.style(title, fg="cyan", bold=True),
+        _RULE,
+        click.style(status, fg=color),
+    ])
+
+
+_REAL_NETWORK_BANNER = _banner(
+    "Privacy Protocol Toolkit for P2P", "\n✓ Using REAL py-libp2p network", "green"
 )
+_SIMULATED_BANNER = _banner(
+    "Privacy Protocol Toolkit for P2P",
+    "\n⚠️  Using simulated data for demonstration",
+    "yellow",
+)
+_DEMO_BANNER = _banner(
+    "Privacy Protocol Toolkit Demonstrations",
+    "\n✓ Running REAL network demonstrations",
+    "green",
+) + "\nThis will run all 5 scenarios with real py-libp2p connections.\n"
+_DEMO_COMPLETE_BANNER = "\n".join([
+    "\n" + _RULE,
+    click.style("✓ All Demonstrations Complete!", fg="green"),
+    _RULE + "\n",
+])
+
+# Fixed styled markers, rendered once instead of on every result line
+_PASS = click.style("PASS", fg="green")
+_FAIL = click.style("FAIL", fg="red")
+_CHECK = click.style("✓", fg="green")
+_CROSS = click.style("✗", fg="red")
+
+
+def _demo_header(title: str) -> str:
+    """Pre-render a demo section header (rule, title, rule)."""
+    return "\n".join([
+        "\n" + "-" * 70,
+        click.style(f"Demo: {title}", fg="cyan", bold=True),
+        "-" * 70,
+    ])
+
+
+_TIMING_DEMO_HEADER = _demo_header("Timing Correlation Detection")
+_LINKABILITY_DEMO_HEADER = _demo_header("Peer Linkability Detection")
+_ANONYMITY_DEMO_HEADER = _demo_header("Anonymity Set Analysis with ZK Proofs")
 
 
 @click.group()
@@ -54,6 +131,38 @@ def main(log_level):
     _configure_logging(log_level)
 
 
+@functools.lru_cache(maxsize=1)
+def _loopback_any() -> Multiaddr:
+    """Ephemeral loopback listen address shared by the short-lived client hosts."""
+    from multiaddr import Multiaddr
+
+    return Multiaddr("/ip4/127.0.0.1/tcp/0")
+
+
+_SIMULATED_PEERS = (
+    ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4001"),
+    ("QmPeer2xyz789ghi012", "/ip4/192.168.1.101/tcp/4001"),
+    ("QmPeer3jkl345mno678", "/ip4/192.168.1.102/tcp/4001"),
+    ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4002"),
+    ("QmPeer4pqr901stu234", "/ip4/192.168.1.103/tcp/4001"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _simulated_peers() -> Tuple[Tuple[str, Multiaddr, str], ...]:
+    """
+    (peer_id, Multiaddr, direction) for --simulate, built once per process.
+
+    Directions alternate outbound/inbound.
+    """
+    from multiaddr import Multiaddr
+
+    return tuple(
+        (peer_id, Multiaddr(addr), "outbound" if i % 2 == 0 else "inbound")
+        for i, (peer_id, addr) in enumerate(_SIMULATED_PEERS)
+    )
+
+
 def _configure_logging(level: str) -> None:
     numeric_level = getattr(logging, level.upper(), logging.WARNING)
     logging.basicConfig(level=numeric_level, force=True)
@@ -68,7 +177,64 @@ def _configure_logging(level: str) -> None:
     logging.getLogger().addFilter(_PeerstoreWarningFilter())
 
 
+@functools.lru_cache(maxsize=1)
+def _get_pedersen_backend():
+    """
+    Build the Pedersen backend once per process for the real-proof helpers.
+
+    Returns None when the backend cannot be created (e.g. petlib missing);
+    the helpers then create their own and report the error themselves.
+    """
+    try:
+        from libp2p_privacy_poc.privacy_protocol.factory import get_zk_backend
+        return get_zk_backend(prefer="pedersen")
+    except Exception:
+        return None
+
+
+def _load_verifier_key(
+    assets_dir: str, statement: str, schema: int, depth: int
+) -> bytes:
+    """
+    Resolve and read the verifying key for a statement once per process.
+
+    Cached on the absolute assets directory, so a later chdir can't return
+    another tree's key. As with AssetsResolver's own cache, fixture files
+    are treated as immutable while the process runs.
+
+    Raises whatever AssetsResolver raises so callers can report it.
+    """
+    return _cached_verifier_key(
+        os.path.realpath(assets_dir), statement, schema, depth
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_verifier_key(
+    assets_dir: str, statement: str, schema: int, depth: int
+) -> bytes:
+    from libp2p_privacy_poc.network.privacyzk.assets import AssetsResolver
+
+    fixture = AssetsResolver(assets_dir).resolve_fixture(statement, schema, depth)
+    return fixture.vk_path.read_bytes()
+
+
+class _EchoStream:
+    """Write-only text stream over click.echo, which strips ANSI when piped."""
+
+    @staticmethod
+    def write(text: str) -> None:
+        click.echo(text, nl=False)
+
+
+def _open_report(path: str):
+    """Open a report file for writing through a large buffer."""
+    return open(path, "w", encoding="utf-8", buffering=1 << 20)
+
+
 def _get_git_commit() -> Optional[str]:
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -82,6 +248,8 @@ def _get_git_commit() -> Optional[str]:
 
 
 def _build_reproducibility(assets_dir: Optional[str]) -> dict:
+    import platform
+
     return {
         "command": " ".join(sys.argv),
         "git_commit": _get_git_commit(),
@@ -120,9 +288,7 @@ def _build_reproducibility(assets_dir: Optional[str]) -> dict:
 )
 @click.option(
     '--zk-backend',
-    type=click.Choice(
-        ['mock', 'pedersen', 'snark-membership', 'snark'], case_sensitive=False
-    ),
+    type=click.Choice(list(_ZK_BACKEND_FLAGS), case_sensitive=False),
     default=None,
     help=(
         'Select ZK backend for proof statements '
@@ -190,6 +356,13 @@ def _build_reproducibility(assets_dir: Optional[str]) -> dict:
     default=False,
     help='Allow fixture proofs for network exchange (default: require real proofs)'
 )
+@click.option(
+    '--progress-interval',
+    type=click.FloatRange(min=0.1),
+    default=2.0,
+    show_default=True,
+    help='Seconds between verbose capture progress updates'
+)
 @click.option(
     '--verbose',
     is_flag=True,
@@ -212,6 +385,7 @@ def analyze(
     zk_timeout,
     zk_assets_dir,
     zk_allow_fixture,
+    progress_interval,
     verbose
 ):
     """
@@ -239,18 +413,19 @@ def analyze(
     Compatibility alias: libp2p-privacy
     """
     import trio
-    
+    from libp2p import new_host
+    from libp2p.peer.peerinfo import info_from_p2p_addr
+    from libp2p.tools.async_service import background_trio_service
+    from multiaddr import Multiaddr
+
+    from libp2p_privacy_poc.metadata_collector import MetadataCollector
+    from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
+    from libp2p_privacy_poc.report_generator import ReportGenerator
+    from libp2p_privacy_poc.utils import get_peer_listening_address
+
     async def _analyze_real_network():
         """Run analysis on real py-libp2p network."""
-        from libp2p import new_host
-        from libp2p.peer.peerinfo import info_from_p2p_addr
-        from libp2p.tools.async_service import background_trio_service
-        from libp2p_privacy_poc.utils import get_peer_listening_address
-        
-        click.echo("\n" + "=" * 70)
-        click.echo(click.style("Privacy Protocol Toolkit for P2P", fg="cyan", bold=True))
-        click.echo("=" * 70)
-        click.echo(click.style("\n✓ Using REAL py-libp2p network", fg="green"))
+        click.echo(_REAL_NETWORK_BANNER)
         
         # Create host
         if verbose:
@@ -271,10 +446,9 @@ def analyze(
         
         async with background_trio_service(network):
             # Start listener with timeout
-            try:
-                with trio.fail_after(5):
-                    await network.listen(Multiaddr(listen_addr))
-            except trio.TooSlowError:
+            with trio.move_on_after(5) as listen_scope:
+                await network.listen(Multiaddr(listen_addr))
+            if listen_scope.cancelled_caught:
                 click.echo(click.style("✗ Timeout starting listener", fg="red"), err=True)
                 return None, None
             
@@ -304,12 +478,13 @@ def analyze(
             # Capture events for specified duration
             click.echo(f"\nCapturing network events for {duration} seconds...")
             if verbose:
-                # Show progress
-                for i in range(duration):
-                    stats = collector.get_statistics()
-                    click.echo(f"  {i+1}s: {stats['total_connections']} connections, {stats['unique_peers']} peers", nl=False)
-                    click.echo("\r", nl=False)
-                    await trio.sleep(1)
+                # Show progress from a side task while the capture window runs
+                async with trio.open_nursery() as nursery:
+                    nursery.start_soon(
+                        _print_capture_progress, collector, progress_interval
+                    )
+                    await trio.sleep(duration)
+                    nursery.cancel_scope.cancel()
                 click.echo()  # New line
             else:
                 await trio.sleep(duration)
@@ -321,20 +496,84 @@ def analyze(
             click.echo(f"  Unique Peers: {stats['unique_peers']}")
             click.echo(f"  Protocols: {stats['protocols_used']}")
             
-            # Cleanup
-            if verbose:
-                click.echo("\nClosing network...")
-            with trio.fail_after(5):
-                await host.close()
+            # The proof exchange runs on its own host, so it can overlap
+            # with shutting this one down
+            async with trio.open_nursery() as nursery:
+                if not offline:
+                    nursery.start_soon(_exchange_proofs, collector)
+                
+                # Cleanup
+                if verbose:
+                    click.echo("\nClosing network...")
+                # A slow close does not invalidate the capture, so give up
+                # on it after the timeout and keep the results
+                with trio.move_on_after(5) as close_scope:
+                    await host.close()
+                if close_scope.cancelled_caught:
+                    click.echo(
+                        click.style("⚠️  Timeout closing host; continuing", fg="yellow"),
+                        err=True,
+                    )
+                
+                # The collector is final once the host is closed; prove over
+                # it on a worker thread while the exchange is still waiting
+                # on the network. If the close timed out the host may still
+                # deliver events, so leave the proof to the regular jobs.
+                if with_real_zk and not close_scope.cancelled_caught:
+                    nursery.start_soon(_prove_real_zk, collector)
             
             return collector, stats
     
+    # Outcome of the real proof exchange, reported after the analysis
+    proof_exchange = {}
+    
+    async def _exchange_proofs(collector):
+        """Exchange SNARK proofs with a captured (or --zk-peer) peer."""
+        try:
+            from libp2p_privacy_poc.network.privacyzk.integration import (
+                try_real_proofs_async,
+            )
+            from libp2p_privacy_poc.network.privacyzk.constants import (
+                STATEMENT_TYPES,
+            )
+            if zk_statement == "all":
+                statements = list(STATEMENT_TYPES)
+            else:
+                statements = [zk_statement]
+            proof_exchange["result"] = await try_real_proofs_async(
+                collector,
+                statements=statements,
+                assets_dir=zk_assets_dir,
+                timeout=zk_timeout,
+                zk_peer=zk_peer,
+                offline=offline,
+                require_real=not zk_allow_fixture,
+            )
+        except Exception as exc:
+            proof_exchange["error"] = exc
+    
+    # Real ZK proof started during the network run, as (result, error)
+    early_proofs = {}
+    
+    async def _prove_real_zk(collector):
+        """Generate the Pedersen+Schnorr proof off the event loop."""
+        from libp2p_privacy_poc.zk_integration import generate_real_commitment_proof
+
+        if verbose:
+            click.echo("\nGenerating real ZK proof (Pedersen+Schnorr)...")
+        job = functools.partial(
+            generate_real_commitment_proof,
+            collector,
+            backend=_get_pedersen_backend(),
+        )
+        try:
+            early_proofs["real_zk"] = (await trio.to_thread.run_sync(job), None)
+        except Exception as exc:
+            early_proofs["real_zk"] = (None, exc)
+    
     def _analyze_simulated():
         """Run analysis with simulated data."""
-        click.echo("\n" + "=" * 70)
-        click.echo(click.style("Privacy Protocol Toolkit for P2P", fg="cyan", bold=True))
-        click.echo("=" * 70)
-        click.echo(click.style("\n⚠️  Using simulated data for demonstration", fg="yellow"))
+        click.echo(_SIMULATED_BANNER)
         
         if verbose:
             click.echo("Creating MetadataCollector...")
@@ -350,13 +589,11 @@ def analyze(
     try:
         with_snark_phase2b = False
         if zk_backend:
-            zk_backend = zk_backend.lower()
-            if zk_backend == "mock":
-                with_zk_proofs = True
-            elif zk_backend == "pedersen":
-                with_real_phase2b = True
-            elif zk_backend in ("snark-membership", "snark"):
-                with_snark_phase2b = True
+            mock_flag, pedersen_flag, with_snark_phase2b = _ZK_BACKEND_FLAGS[
+                zk_backend.lower()
+            ]
+            with_zk_proofs = with_zk_proofs or mock_flag
+            with_real_phase2b = with_real_phase2b or pedersen_flag
 
         # Run analysis (real or simulated)
         if simulate:
@@ -378,6 +615,15 @@ def analyze(
         click.echo(f"  Risk Score: {report.overall_risk_score:.2f}/1.00")
         click.echo(f"  Risks Detected: {len(report.risks)}")
         
+        # Mock proofs are generated at most once, however many branches need them
+        mock_proofs = None
+
+        def _get_mock_proofs():
+            nonlocal mock_proofs
+            if mock_proofs is None:
+                mock_proofs = _generate_zk_proofs(collector, verbose)
+            return mock_proofs
+        
         # Generate ZK proofs if requested
         zk_proofs = None
         real_zk_proof = None
@@ -387,25 +633,9 @@ def analyze(
         proof_exchange_summary = None
         if not simulate and not offline:
             try:
-                from libp2p_privacy_poc.network.privacyzk.integration import (
-                    try_real_proofs,
-                )
-                from libp2p_privacy_poc.network.privacyzk.constants import (
-                    STATEMENT_TYPES,
-                )
-                if zk_statement == "all":
-                    statements = list(STATEMENT_TYPES)
-                else:
-                    statements = [zk_statement]
-                exchange = try_real_proofs(
-                    collector,
-                    statements=statements,
-                    assets_dir=zk_assets_dir,
-                    timeout=zk_timeout,
-                    zk_peer=zk_peer,
-                    offline=offline,
-                    require_real=not zk_allow_fixture,
-                )
+                if "error" in proof_exchange:
+                    raise proof_exchange["error"]
+                exchange = proof_exchange["result"]
                 proof_exchange_summary = exchange.summary
                 if exchange.attempted:
                     network_snark_proofs = exchange.results
@@ -446,16 +676,58 @@ def analyze(
                     )
                 )
                 proof_exchange_summary = None
+        # Collect each enabled generator's result or error, then report them
+        # in the usual order
+        proof_jobs = {}
         if with_zk_proofs:
             if verbose:
                 click.echo("\nGenerating mock ZK proofs...")
-            zk_proofs = _generate_zk_proofs(collector, verbose)
-            click.echo(click.style(f"✓ Generated {sum(len(v) for v in zk_proofs.values())} ZK proofs", fg="green"))
+            proof_jobs["mock"] = _get_mock_proofs
+        if with_real_zk and "real_zk" not in early_proofs:
+            from libp2p_privacy_poc.zk_integration import (
+                generate_real_commitment_proof,
+            )
 
-        if with_real_zk:
             if verbose:
                 click.echo("\nGenerating real ZK proof (Pedersen+Schnorr)...")
-            real_zk_proof = generate_real_commitment_proof(collector)
+            proof_jobs["real_zk"] = functools.partial(
+                generate_real_commitment_proof,
+                collector,
+                backend=_get_pedersen_backend(),
+            )
+        if with_real_phase2b:
+            from libp2p_privacy_poc.zk_integration import generate_real_phase2b_proofs
+
+            if verbose:
+                click.echo("\nGenerating real proof statements...")
+            proof_jobs["real_phase2b"] = functools.partial(
+                generate_real_phase2b_proofs,
+                collector,
+                backend=_get_pedersen_backend(),
+            )
+        if with_snark_phase2b:
+            from libp2p_privacy_poc.zk_integration import generate_snark_phase2b_proofs
+
+            if verbose:
+                click.echo("\nGenerating SNARK proof statement...")
+            proof_jobs["snark"] = functools.partial(
+                generate_snark_phase2b_proofs, collector
+            )
+        proof_results = _run_proof_jobs(proof_jobs)
+        proof_results.update(early_proofs)
+
+        def _proof_result(name):
+            value, error = proof_results[name]
+            if error is not None:
+                raise error
+            return value
+
+        if with_zk_proofs:
+            zk_proofs = _proof_result("mock")
+            click.echo(click.style(f"✓ Generated {sum(len(v) for v in zk_proofs.values())} ZK proofs", fg="green"))
+
+        if with_real_zk:
+            real_zk_proof = _proof_result("real_zk")
             if real_zk_proof.get("verified"):
                 click.echo(click.style("✓ Real ZK proof verified", fg="green"))
             else:
@@ -468,9 +740,7 @@ def analyze(
                 )
 
         if with_real_phase2b:
-            if verbose:
-                click.echo("\nGenerating real proof statements...")
-            real_phase2b_proofs = generate_real_phase2b_proofs(collector)
+            real_phase2b_proofs = _proof_result("real_phase2b")
             verified_count = sum(
                 1 for item in real_phase2b_proofs if item.get("verified")
             )
@@ -490,19 +760,15 @@ def analyze(
                 )
 
         if with_snark_phase2b:
-            if verbose:
-                click.echo("\nGenerating SNARK proof statement...")
-            try:
-                snark_phase2b_proofs = generate_snark_phase2b_proofs(collector)
-            except Exception as exc:
+            snark_phase2b_proofs, snark_error = proof_results["snark"]
+            if snark_error is not None:
                 click.echo(
                     click.style(
-                        f"⚠️  SNARK proof statements unavailable: {exc}",
+                        f"⚠️  SNARK proof statements unavailable: {snark_error}",
                         fg="yellow",
                     )
                 )
-                if zk_proofs is None:
-                    zk_proofs = _generate_zk_proofs(collector, verbose)
+                zk_proofs = _get_mock_proofs()
             else:
                 verified_count = sum(
                     1 for item in snark_phase2b_proofs if item.get("verified")
@@ -521,8 +787,7 @@ def analyze(
                             fg="yellow",
                         )
                     )
-                    if zk_proofs is None:
-                        zk_proofs = _generate_zk_proofs(collector, verbose)
+                    zk_proofs = _get_mock_proofs()
 
         if network_snark_proofs:
             if snark_phase2b_proofs:
@@ -539,74 +804,68 @@ def analyze(
         warnings = collector.get_warnings() if collector else []
         reproducibility = _build_reproducibility(zk_assets_dir)
         
+        # Reports are streamed to their destination section by section
+        # rather than rendered to one string first
+        report_options = dict(
+            real_zk_proof=real_zk_proof,
+            real_phase2b_proofs=real_phase2b_proofs,
+            snark_phase2b_proofs=snark_phase2b_proofs,
+            data_source=data_source,
+            proof_exchange_summary=proof_exchange_summary,
+            warnings=warnings,
+            reproducibility=reproducibility,
+        )
         if format == 'console':
-            report_content = report_gen.generate_console_report(
-                report,
-                zk_proofs,
-                verbose=verbose,
-                real_zk_proof=real_zk_proof,
-                real_phase2b_proofs=real_phase2b_proofs,
-                snark_phase2b_proofs=snark_phase2b_proofs,
-                data_source=data_source,
-                proof_exchange_summary=proof_exchange_summary,
-                warnings=warnings,
-                reproducibility=reproducibility,
-            )
             if output:
-                Path(output).write_text(report_content)
+                with _open_report(output) as handle:
+                    report_gen.stream_console_report(
+                        handle, report, zk_proofs, verbose=verbose, **report_options
+                    )
                 click.echo(f"\n{click.style(f'✓ Report saved to: {output}', fg='green')}")
             else:
-                click.echo("\n" + report_content)
+                click.echo()
+                report_gen.stream_console_report(
+                    _EchoStream, report, zk_proofs, verbose=verbose, **report_options
+                )
+                click.echo()
         
         elif format == 'json':
-            report_content = report_gen.generate_json_report(
-                report,
-                zk_proofs,
-                real_zk_proof=real_zk_proof,
-                real_phase2b_proofs=real_phase2b_proofs,
-                snark_phase2b_proofs=snark_phase2b_proofs,
-                data_source=data_source,
-                proof_exchange_summary=proof_exchange_summary,
-                warnings=warnings,
-                reproducibility=reproducibility,
-            )
             output_path = output or "privacy_report.json"
-            Path(output_path).write_text(report_content)
+            with _open_report(output_path) as handle:
+                report_gen.stream_json_report(
+                    handle, report, zk_proofs, **report_options
+                )
             click.echo(f"\n{click.style(f'✓ JSON report saved to: {output_path}', fg='green')}")
             
         elif format == 'html':
-            report_content = report_gen.generate_html_report(
-                report,
-                zk_proofs,
-                real_zk_proof=real_zk_proof,
-                real_phase2b_proofs=real_phase2b_proofs,
-                snark_phase2b_proofs=snark_phase2b_proofs,
-                data_source=data_source,
-                proof_exchange_summary=proof_exchange_summary,
-                warnings=warnings,
-                reproducibility=reproducibility,
-            )
             output_path = output or "privacy_report.html"
-            Path(output_path).write_text(report_content)
+            with _open_report(output_path) as handle:
+                report_gen.stream_html_report(
+                    handle, report, zk_proofs, **report_options
+                )
             click.echo(f"\n{click.style(f'✓ HTML report saved to: {output_path}', fg='green')}")
         
-        click.echo("\n" + "=" * 70)
+        click.echo("\n" + _RULE)
         
     except Exception as e:
-        click.echo(click.style(f"\n✗ Error: {e}", fg="red"), err=True)
+        click.echo(click.style(f"\n✗ Error: {_error_message(e, verbose)}", fg="red"), err=True)
         if verbose:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
 
 
 @main.command()
+@click.option(
+    '--isolated',
+    is_flag=True,
+    help='Run the demo script in a separate Python process'
+)
 @click.option(
     '--verbose',
     is_flag=True,
     help='Enable verbose output'
 )
-def demo(verbose):
+def demo(isolated, verbose):
     """
     Run demonstration scenarios showing privacy analysis capabilities with REAL connections.
     
@@ -625,18 +884,10 @@ def demo(verbose):
     
     Note: This command runs the full demo_scenarios.py script which may take 1-2 minutes.
     """
-    import trio
-    import subprocess
-    
     try:
-        click.echo("\n" + "=" * 70)
-        click.echo(click.style("Privacy Protocol Toolkit Demonstrations", fg="cyan", bold=True))
-        click.echo("=" * 70)
-        click.echo(click.style("\n✓ Running REAL network demonstrations", fg="green"))
-        click.echo("This will run all 5 scenarios with real py-libp2p connections.\n")
+        click.echo(_DEMO_BANNER)
         
         # Run the demo_scenarios.py script
-        import os
         examples_dir = os.path.join(os.path.dirname(__file__), '..', 'examples')
         demo_script = os.path.join(examples_dir, 'demo_scenarios.py')
         
@@ -644,25 +895,56 @@ def demo(verbose):
             click.echo(click.style(f"✗ Demo script not found: {demo_script}", fg="red"), err=True)
             sys.exit(1)
         
-        # Run the script
-        result = subprocess.run(
-            [sys.executable, demo_script],
-            cwd=os.path.dirname(demo_script),
-            capture_output=False if verbose else True
-        )
+        demo_module = None
+        if not isolated:
+            # Load the script as a module so it reuses this process's
+            # already-imported libp2p and crypto stacks
+            import importlib.util
+            spec = importlib.util.spec_from_file_location("demo_scenarios", demo_script)
+            demo_module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(demo_module)
+            except ImportError as exc:
+                if verbose:
+                    click.echo(f"In-process demo unavailable ({exc}); running it in a subprocess")
+                demo_module = None
+        
+        if demo_module is None:
+            import subprocess
+            result = subprocess.run(
+                [sys.executable, demo_script],
+                cwd=os.path.dirname(demo_script),
+                capture_output=False if verbose else True
+            )
+            returncode = result.returncode
+        else:
+            import io
+            import trio
+            # Match the subprocess path: output is captured unless verbose,
+            # and a failing demo reports through the exit-code branch below
+            with contextlib.ExitStack() as quiet:
+                if not verbose:
+                    quiet.enter_context(contextlib.redirect_stdout(io.StringIO()))
+                    quiet.enter_context(contextlib.redirect_stderr(io.StringIO()))
+                    logging.disable(logging.CRITICAL)
+                    quiet.callback(logging.disable, logging.NOTSET)
+                try:
+                    trio.run(demo_module.main)
+                    returncode = 0
+                except Exception:
+                    if verbose:
+                        traceback.print_exc()
+                    returncode = 1
         
-        if result.returncode == 0:
-            click.echo("\n" + "=" * 70)
-            click.echo(click.style("✓ All Demonstrations Complete!", fg="green"))
-            click.echo("=" * 70 + "\n")
+        if returncode == 0:
+            click.echo(_DEMO_COMPLETE_BANNER)
         else:
-            click.echo(click.style(f"\n✗ Demo failed with exit code {result.returncode}", fg="red"), err=True)
-            sys.exit(result.returncode)
+            click.echo(click.style(f"\n✗ Demo failed with exit code {returncode}", fg="red"), err=True)
+            sys.exit(returncode)
         
     except Exception as e:
-        click.echo(click.style(f"\n✗ Error: {e}", fg="red"), err=True)
+        click.echo(click.style(f"\n✗ Error: {_error_message(e, verbose)}", fg="red"), err=True)
         if verbose:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
 
@@ -723,6 +1005,8 @@ def zk_serve(listen_addr, host, port, prove_mode, assets_dir, strict, verbose):
     import trio
     from libp2p import new_host
     from libp2p.tools.async_service import background_trio_service
+    from multiaddr import Multiaddr
+
     from libp2p_privacy_poc.utils import get_peer_listening_address
     from libp2p_privacy_poc.network.privacyzk.protocol import register_privacyzk_protocol
     from libp2p_privacy_poc.network.privacyzk.provider import (
@@ -765,6 +1049,8 @@ def zk_serve(listen_addr, host, port, prove_mode, assets_dir, strict, verbose):
         )
         provider = HybridProofProvider(config, fixture_provider=fixture, real_provider=real)
 
+    listen_ma = Multiaddr(listen_addr)
+
     async def _serve():
         host_obj = new_host()
         register_privacyzk_protocol(host_obj, provider)
@@ -773,7 +1059,7 @@ def zk_serve(listen_addr, host, port, prove_mode, assets_dir, strict, verbose):
         async with background_trio_service(network):
             if verbose:
                 click.echo(f"Listening on {listen_addr} ...")
-            listen_ok = await network.listen(Multiaddr(listen_addr))
+            listen_ok = await network.listen(listen_ma)
             if not listen_ok:
                 click.echo("Error: failed to start listener", err=True)
                 return
@@ -785,7 +1071,7 @@ def zk_serve(listen_addr, host, port, prove_mode, assets_dir, strict, verbose):
                 if "/tcp/0" in listen_addr:
                     click.echo(f"Error: failed to obtain listening address: {exc}", err=True)
                     return
-                actual_addr = Multiaddr(listen_addr).encapsulate(Multiaddr(f"/p2p/{peer_id}"))
+                actual_addr = listen_ma.encapsulate(Multiaddr(f"/p2p/{peer_id}"))
                 click.echo(f"Warning: using configured listen address; {exc}")
             click.echo(f"Listening: {actual_addr}")
             click.echo("Serving privacyzk protocol. Press Ctrl+C to stop.")
@@ -850,30 +1136,16 @@ def zk_verify(peer, statement, schema, depth, assets_dir, timeout, as_json, requ
     """
     Request a proof from a peer and verify it locally.
     """
-    import secrets
     import trio
-    from libp2p import new_host
-    from libp2p.peer.id import ID
-    from libp2p.peer.peerinfo import info_from_p2p_addr
-    from libp2p.tools.async_service import background_trio_service
-    from libp2p_privacy_poc.network.privacyzk.assets import AssetsResolver
     from libp2p_privacy_poc.network.privacyzk.client import request_proof
     from libp2p_privacy_poc.network.privacyzk.messages import ProofRequest
-    from libp2p_privacy_poc.network.privacyzk.constants import (
-        DEFAULT_MEMBERSHIP_DEPTH,
-        MSG_V,
-    )
-    from libp2p_privacy_poc.privacy_protocol.snark.backend import SnarkBackend
+    from libp2p_privacy_poc.network.privacyzk.constants import MSG_V
 
     statement = statement.lower()
-    if depth is None:
-        depth = DEFAULT_MEMBERSHIP_DEPTH if statement == "membership" else 0
-
-    if statement != "membership" and depth != 0:
-        click.echo("Depth must be 0 for continuity/unlinkability", err=True)
-        sys.exit(2)
-    if statement == "membership" and depth < 1:
-        click.echo("Depth must be >= 1 for membership", err=True)
+    try:
+        depth = _normalize_depth(statement, depth)
+    except ValueError as exc:
+        click.echo(str(exc), err=True)
         sys.exit(2)
 
     req = ProofRequest(
@@ -881,21 +1153,12 @@ def zk_verify(peer, statement, schema, depth, assets_dir, timeout, as_json, requ
         t=statement,
         schema_v=schema,
         d=depth,
-        nonce=secrets.token_bytes(16),
+        nonce=_request_nonce(),
     )
 
     async def _run_request():
-        host_obj = new_host()
-        network = host_obj.get_network()
-        async with background_trio_service(network):
-            await network.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-            if peer.startswith("/"):
-                peer_info = info_from_p2p_addr(Multiaddr(peer))
-                with trio.fail_after(timeout):
-                    await host_obj.connect(peer_info)
-                peer_id = peer_info.peer_id
-            else:
-                peer_id = ID.from_base58(peer)
+        async with _verifier_host() as host_obj:
+            peer_id = await _connect_verifier(host_obj, peer, timeout)
             with trio.fail_after(timeout):
                 return await request_proof(
                     host_obj, peer_id, req, timeout=timeout
@@ -915,86 +1178,164 @@ def zk_verify(peer, statement, schema, depth, assets_dir, timeout, as_json, requ
         )
         sys.exit(1)
 
-    if response.t != statement or response.schema_v != schema or response.d != depth:
-        _emit_result(
-            as_json,
-            ok=False,
-            verified=False,
-            statement=statement,
-            schema=schema,
-            depth=depth,
-            error="response metadata mismatch",
-        )
-        sys.exit(1)
+    ok, verified, error, exit_code = _check_proof_response(
+        response, statement, schema, depth, assets_dir, require_real
+    )
+    _emit_result(
+        as_json,
+        ok=ok,
+        verified=verified,
+        statement=statement,
+        schema=schema,
+        depth=depth,
+        error=error,
+    )
+    sys.exit(exit_code)
 
-    if not response.ok:
-        _emit_result(
-            as_json,
-            ok=False,
-            verified=False,
-            statement=statement,
-            schema=schema,
-            depth=depth,
-            error=response.err or "proof request failed",
-        )
-        sys.exit(1)
 
-    if require_real:
-        prove_mode = None
-        meta_bytes = getattr(response, "meta", b"") or b""
-        if meta_bytes:
-            try:
-                import cbor2
+@main.command(name="zk-verify-batch")
+@click.option(
+    "--peer",
+    required=True,
+    help="Peer multiaddr (/ip4/.../p2p/<peer-id>) or peer ID",
+)
+@click.option(
+    "--assets-dir",
+    type=click.Path(),
+    default="privacy_circuits/params",
+    help="Base directory for verifier assets",
+)
+@click.option(
+    "--timeout",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Per-request timeout in seconds",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Output one JSON result per request",
+)
+@click.option(
+    "--require-real",
+    is_flag=True,
+    help="Fail requests the server did not prove for real",
+)
+def zk_verify_batch(peer, assets_dir, timeout, as_json, require_real):
+    """
+    Verify several proofs from one peer over a single host.
 
-                meta = cbor2.loads(meta_bytes)
-                prove_mode = meta.get("prove_mode")
-            except Exception:
-                prove_mode = None
-        if prove_mode != "real":
+    Reads one request per line from stdin as "<statement> [schema] [depth]"
+    (blank lines and lines starting with # are skipped). The host is set up
+    and connected once, then reused for every request.
+
+    Exits 1 if any request errored, 2 if any proof failed verification.
+    """
+    import trio
+    from libp2p_privacy_poc.network.privacyzk.client import request_proof
+    from libp2p_privacy_poc.network.privacyzk.messages import ProofRequest
+    from libp2p_privacy_poc.network.privacyzk.constants import MSG_V
+
+    # One (request, parse error) entry per input line, in input order
+    entries = []
+    for line_no, line in enumerate(sys.stdin, start=1):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        try:
+            statement, schema, depth = _parse_batch_request(fields)
+        except ValueError as exc:
+            entries.append((fields[0].lower(), f"line {line_no}: {exc}"))
+            continue
+        req = ProofRequest(
+            msg_v=MSG_V,
+            t=statement,
+            schema_v=schema,
+            d=depth,
+            nonce=_request_nonce(),
+        )
+        entries.append((req, None))
+    requests = [req for req, error in entries if error is None]
+
+    async def _run_requests():
+        responses = []
+        async with _verifier_host() as host_obj:
+            peer_id = await _connect_verifier(host_obj, peer, timeout)
+            for req in requests:
+                try:
+                    with trio.fail_after(timeout):
+                        response = await request_proof(
+                            host_obj, peer_id, req, timeout=timeout
+                        )
+                except Exception as exc:
+                    response = exc
+                responses.append(response)
+        return responses
+
+    if requests:
+        try:
+            responses = trio.run(_run_requests)
+        except Exception as exc:
+            responses = [exc] * len(requests)
+    else:
+        responses = []
+
+    # Responses that pass the request checks are verified in one batch per
+    # (statement, schema, depth), so each key and binding is set up once
+    outcomes = [None] * len(requests)
+    groups = {}
+    for index, (req, response) in enumerate(zip(requests, responses)):
+        if isinstance(response, Exception):
+            outcomes[index] = (False, False, _format_exception(response), 1)
+            continue
+        outcomes[index] = _precheck_proof_response(
+            response, req.t, req.schema_v, req.d, require_real
+        )
+        if outcomes[index] is None:
+            groups.setdefault((req.t, req.schema_v, req.d), []).append(index)
+    for (statement, schema, depth), indexes in groups.items():
+        batch = _verify_proof_responses(
+            [responses[index] for index in indexes],
+            statement,
+            schema,
+            depth,
+            assets_dir,
+        )
+        for index, outcome in zip(indexes, batch):
+            outcomes[index] = outcome
+
+    pending = iter(outcomes)
+    exit_code = 0
+    for req, error in entries:
+        if error is not None:
             _emit_result(
                 as_json,
                 ok=False,
                 verified=False,
-                statement=statement,
-                schema=schema,
-                depth=depth,
-                error=f"expected prove_mode=real, got {prove_mode or 'unknown'}",
+                statement=req,
+                schema=None,
+                depth=None,
+                error=error,
             )
-            sys.exit(1)
-
-    try:
-        resolver = AssetsResolver(assets_dir)
-        fixture = resolver.resolve_fixture(statement, schema, depth)
-    except Exception as exc:
+            exit_code = 1
+            continue
+        ok, verified, error, code = next(pending)
         _emit_result(
             as_json,
-            ok=True,
-            verified=False,
-            statement=statement,
-            schema=schema,
-            depth=depth,
-            error=f"vk resolution failed: {exc}",
+            ok=ok,
+            verified=verified,
+            statement=req.t,
+            schema=req.schema_v,
+            depth=req.d,
+            error=error,
         )
-        sys.exit(1)
-
-    verified = SnarkBackend.verify(
-        statement_type=statement,
-        schema_version=schema,
-        vk=str(fixture.vk_path),
-        public_inputs=response.public_inputs,
-        proof=response.proof,
-    )
-
-    _emit_result(
-        as_json,
-        ok=True,
-        verified=verified,
-        statement=statement,
-        schema=schema,
-        depth=depth,
-        error=None if verified else "verification failed",
-    )
-    sys.exit(0 if verified else 2)
+        if code == 1:
+            exit_code = 1
+        elif code and not exit_code:
+            exit_code = code
+    sys.exit(exit_code)
 
 
 @main.command(name="zk-dial")
@@ -1008,7 +1349,7 @@ def zk_verify(peer, statement, schema, depth, assets_dir, timeout, as_json, requ
     type=int,
     default=1,
     show_default=True,
-    help="Number of concurrent dialers",
+    help="Number of concurrent dialers, each with its own peer identity",
 )
 @click.option(
     "--duration",
@@ -1025,6 +1366,7 @@ def zk_dial(peer, count, duration):
     from libp2p import new_host
     from libp2p.peer.peerinfo import info_from_p2p_addr
     from libp2p.tools.async_service import background_trio_service
+    from multiaddr import Multiaddr
 
     if count < 1:
         click.echo("Count must be >= 1", err=True)
@@ -1036,11 +1378,14 @@ def zk_dial(peer, count, duration):
     peer_info = info_from_p2p_addr(Multiaddr(peer))
     click.echo(f"Dialing {peer} with {count} peer(s) for {duration}s")
 
+    # Every dialer gets its own host on purpose: the point is to show up as
+    # `count` distinct peers, and one shared host would reuse a single
+    # connection to the peer however many times it dialed
     async def _dial_one() -> None:
         host_obj = new_host()
         network = host_obj.get_network()
         async with background_trio_service(network):
-            await network.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+            await network.listen(_loopback_any())
             await host_obj.connect(peer_info)
             await trio.sleep(duration)
         await host_obj.close()
@@ -1060,14 +1405,161 @@ def zk_dial(peer, count, duration):
 
 
 def _format_exception(exc: BaseException) -> str:
-    if isinstance(exc, BaseExceptionGroup):
-        parts = []
-        for sub_exc in exc.exceptions:
-            msg = _format_exception(sub_exc)
-            if msg:
-                parts.append(msg)
-        return "; ".join(parts) if parts else str(exc)
-    return str(exc)
+    """Join the messages of the leaf exceptions in (nested) exception groups."""
+    parts = []
+    stack = [exc]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, BaseExceptionGroup):
+            stack.extend(reversed(current.exceptions))
+            continue
+        msg = str(current)
+        if msg:
+            parts.append(msg)
+    return "; ".join(parts) if parts else str(exc)
+
+
+def _error_message(exc: BaseException, verbose: bool) -> str:
+    """
+    Message for a command's top-level error line.
+
+    Only --verbose walks exception groups down to their leaf messages;
+    otherwise the top-level message is used as is.
+    """
+    return _format_exception(exc) if verbose else str(exc)
+
+
+@contextlib.asynccontextmanager
+async def _verifier_host():
+    """Run a short-lived client host listening on loopback."""
+    from libp2p import new_host
+    from libp2p.tools.async_service import background_trio_service
+
+    host_obj = new_host()
+    network = host_obj.get_network()
+    async with background_trio_service(network):
+        await network.listen(_loopback_any())
+        yield host_obj
+
+
+async def _connect_verifier(host_obj, peer: str, timeout: int):
+    """Connect to ``peer`` (multiaddr or bare peer ID) and return its ID."""
+    import trio
+    from libp2p.peer.id import ID
+    from libp2p.peer.peerinfo import info_from_p2p_addr
+    from multiaddr import Multiaddr
+
+    if not peer.startswith("/"):
+        return ID.from_base58(peer)
+    peer_info = info_from_p2p_addr(Multiaddr(peer))
+    with trio.fail_after(timeout):
+        await host_obj.connect(peer_info)
+    return peer_info.peer_id
+
+
+def _normalize_depth(statement: str, depth: Optional[int]) -> int:
+    """Apply the default Merkle depth and reject depths the statement can't use."""
+    from libp2p_privacy_poc.network.privacyzk.constants import (
+        DEFAULT_MEMBERSHIP_DEPTH,
+    )
+
+    if depth is None:
+        depth = DEFAULT_MEMBERSHIP_DEPTH if statement == "membership" else 0
+    if statement != "membership" and depth != 0:
+        raise ValueError("Depth must be 0 for continuity/unlinkability")
+    if statement == "membership" and depth < 1:
+        raise ValueError("Depth must be >= 1 for membership")
+    return depth
+
+
+def _parse_batch_request(fields) -> Tuple[str, int, int]:
+    """Parse a zk-verify-batch line split into ``statement [schema] [depth]``."""
+    if len(fields) > 3:
+        raise ValueError("expected: <statement> [schema] [depth]")
+    statement = fields[0].lower()
+    if statement not in ("membership", "continuity", "unlinkability"):
+        raise ValueError(f"unknown statement {fields[0]!r}")
+    try:
+        schema = int(fields[1]) if len(fields) > 1 else 2
+        depth = int(fields[2]) if len(fields) > 2 else None
+    except ValueError:
+        raise ValueError("schema and depth must be integers") from None
+    return statement, schema, _normalize_depth(statement, depth)
+
+
+def _response_prove_mode(response) -> Optional[str]:
+    """Return the prove_mode a response's CBOR meta reports, if any."""
+    meta_bytes = getattr(response, "meta", b"") or b""
+    if not meta_bytes:
+        return None
+    import cbor2
+
+    try:
+        meta = cbor2.loads(meta_bytes)
+    except Exception:
+        return None
+    if not isinstance(meta, dict):
+        return None
+    return meta.get("prove_mode")
+
+
+def _check_proof_response(response, statement, schema, depth, assets_dir, require_real):
+    """
+    Check a proof response against the request and verify it locally.
+
+    Returns:
+        (ok, verified, error, exit_code) as reported by zk-verify
+    """
+    failure = _precheck_proof_response(response, statement, schema, depth, require_real)
+    if failure is not None:
+        return failure
+    return _verify_proof_responses([response], statement, schema, depth, assets_dir)[0]
+
+
+def _precheck_proof_response(response, statement, schema, depth, require_real):
+    """Return the zk-verify outcome for a response that can't be verified, else None."""
+    if response.t != statement or response.schema_v != schema or response.d != depth:
+        return False, False, "response metadata mismatch", 1
+
+    if not response.ok:
+        return False, False, response.err or "proof request failed", 1
+
+    if require_real:
+        prove_mode = _response_prove_mode(response)
+        if prove_mode != "real":
+            return (
+                False,
+                False,
+                f"expected prove_mode=real, got {prove_mode or 'unknown'}",
+                1,
+            )
+    return None
+
+
+def _verify_proof_responses(responses, statement, schema, depth, assets_dir):
+    """
+    Verify prechecked responses for one statement/schema/depth in one batch.
+
+    Returns:
+        One (ok, verified, error, exit_code) outcome per response, in order
+    """
+    from libp2p_privacy_poc.privacy_protocol.snark.backend import SnarkBackend
+
+    try:
+        vk_bytes = _load_verifier_key(assets_dir, statement, schema, depth)
+    except Exception as exc:
+        return [(True, False, f"vk resolution failed: {exc}", 1)] * len(responses)
+
+    verified = SnarkBackend.verify_batch(
+        statement_type=statement,
+        schema_version=schema,
+        vk=vk_bytes,
+        items=[(response.public_inputs, response.proof) for response in responses],
+    )
+    return [
+        (True, True, None, 0) if ok else (True, False, "verification failed", 2)
+        for ok in verified
+    ]
 
 
 def _emit_result(as_json, ok, verified, statement, schema, depth, error):
@@ -1083,30 +1575,63 @@ def _emit_result(as_json, ok, verified, statement, schema, depth, error):
         click.echo(json.dumps(payload))
     else:
         if verified:
-            click.echo(click.style("PASS", fg="green"))
+            click.echo(_PASS)
         else:
-            click.echo(click.style("FAIL", fg="red"))
+            click.echo(_FAIL)
         if error:
             click.echo(f"Error: {error}")
 
 
+def _run_proof_jobs(jobs: Dict[str, Callable[[], Any]]) -> Dict[str, Tuple[Any, Optional[Exception]]]:
+    """
+    Run the enabled proof generators one after another.
+
+    They share the process-wide Pedersen backend, which is not documented as
+    thread-safe, and are CPU-bound under the GIL, so they are not threaded.
+
+    Returns:
+        Mapping of job name to (result, error); error is None on success
+    """
+    results: Dict[str, Tuple[Any, Optional[Exception]]] = {}
+    for name, job in jobs.items():
+        try:
+            results[name] = (job(), None)
+        except Exception as exc:
+            results[name] = (None, exc)
+    return results
+
+
+async def _print_capture_progress(collector: MetadataCollector, interval: float):
+    """Print capture statistics every ``interval`` seconds until cancelled."""
+    import trio
+
+    start = trio.current_time()
+    while True:
+        await trio.sleep(interval)
+        elapsed = trio.current_time() - start
+        stats = collector.get_statistics()
+        # Rewrite the same terminal line in place, one write per tick
+        sys.stdout.write(
+            f"\r  {elapsed:.0f}s: {stats['total_connections']} connections, "
+            f"{stats['unique_peers']} peers"
+        )
+        sys.stdout.flush()
+
+
 def _simulate_network_activity(collector: MetadataCollector, verbose: bool = False):
     """Simulate network activity for demonstration."""
-    peers = [
-        ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4001"),
-        ("QmPeer2xyz789ghi012", "/ip4/192.168.1.101/tcp/4001"),
-        ("QmPeer3jkl345mno678", "/ip4/192.168.1.102/tcp/4001"),
-        ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4002"),
-        ("QmPeer4pqr901stu234", "/ip4/192.168.1.103/tcp/4001"),
-    ]
+    peers = _simulated_peers()
     
-    for i, (peer_id_str, addr_str) in enumerate(peers):
+    # Stamp events 50ms apart for the timing analysis instead of sleeping,
+    # ending at the current time
+    start = time.time() - 0.05 * (len(peers) - 1)
+    for i, (peer_id_str, addr, direction) in enumerate(peers):
         collector.on_connection_opened(
             peer_id=peer_id_str,
-            multiaddr=Multiaddr(addr_str),
-            direction="outbound" if i % 2 == 0 else "inbound"
+            multiaddr=addr,
+            direction=direction,
+            timestamp=start + 0.05 * i,
         )
-        time.sleep(0.05)
     
     # Simulate protocol negotiations
     collector.on_protocol_negotiated("QmPeer1abc123def456", "/ipfs/id/1.0.0")
@@ -1115,27 +1640,38 @@ def _simulate_network_activity(collector: MetadataCollector, verbose: bool = Fal
     # Simulate stream activity
     collector.on_stream_opened("QmPeer1abc123def456")
     collector.on_stream_opened("QmPeer2xyz789ghi012")
+    
+    if verbose:
+        click.echo(f"  Simulated {len(peers)} connections, 2 protocols, 2 streams")
 
 
 def _generate_zk_proofs(collector: MetadataCollector, verbose: bool = False):
     """Generate mock ZK proofs for demonstration."""
+    from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem
+
     zk_system = MockZKProofSystem()
     zk_proofs = {}
     
-    peer_ids = list(collector.peers.keys())
-    if peer_ids:
+    # Only the first two peers and the count are needed, so avoid copying
+    # every peer id into a list
+    peer_count = len(collector.peers)
+    if peer_count:
+        peer_ids = iter(collector.peers)
+        first_peer = next(peer_ids)
+        second_peer = next(peer_ids, None)
+
         # Anonymity set proof
         anonymity_proof = zk_system.generate_anonymity_set_proof(
-            peer_id=peer_ids[0],
-            anonymity_set_size=len(peer_ids)
+            peer_id=first_peer,
+            anonymity_set_size=peer_count
         )
         zk_proofs["anonymity_set"] = [anonymity_proof]
         
         # Unlinkability proof (if multiple peers)
-        if len(peer_ids) >= 2:
+        if second_peer is not None:
             unlinkability_proof = zk_system.generate_unlinkability_proof(
-                session_1_id=peer_ids[0],
-                session_2_id=peer_ids[1]
+                session_1_id=first_peer,
+                session_2_id=second_peer
             )
             zk_proofs["unlinkability"] = [unlinkability_proof]
     
@@ -1144,21 +1680,26 @@ def _generate_zk_proofs(collector: MetadataCollector, verbose: bool = False):
 
 def _demo_timing_correlation(verbose: bool):
     """Demonstrate timing correlation detection."""
-    click.echo("\n" + "-" * 70)
-    click.echo(click.style("Demo: Timing Correlation Detection", fg="cyan", bold=True))
-    click.echo("-" * 70)
+    from multiaddr import Multiaddr
+
+    from libp2p_privacy_poc.metadata_collector import MetadataCollector
+    from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
+
+    click.echo(_TIMING_DEMO_HEADER)
     click.echo("\nThis demo shows how timing patterns can leak privacy information.")
     
     collector = MetadataCollector()
     
-    # Create regular timing pattern
+    # Create regular timing pattern (100ms apart, stamped rather than slept)
+    start = time.time() - 0.4
+    addr = Multiaddr("/ip4/127.0.0.1/tcp/4001")
     for i in range(5):
         collector.on_connection_opened(
             peer_id=f"QmPeer{i}",
-            multiaddr=Multiaddr("/ip4/127.0.0.1/tcp/4001"),
-            direction="outbound"
+            multiaddr=addr,
+            direction="outbound",
+            timestamp=start + 0.1 * i,
         )
-        time.sleep(0.1)  # Regular interval
     
     analyzer = PrivacyAnalyzer(collector)
     report = analyzer.analyze()
@@ -1172,19 +1713,23 @@ def _demo_timing_correlation(verbose: bool):
 
 def _demo_peer_linkability(verbose: bool):
     """Demonstrate peer linkability detection."""
-    click.echo("\n" + "-" * 70)
-    click.echo(click.style("Demo: Peer Linkability Detection", fg="cyan", bold=True))
-    click.echo("-" * 70)
+    from multiaddr import Multiaddr
+
+    from libp2p_privacy_poc.metadata_collector import MetadataCollector
+    from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
+
+    click.echo(_LINKABILITY_DEMO_HEADER)
     click.echo("\nThis demo shows how multiple connections can be linked to the same peer.")
     
     collector = MetadataCollector()
     
     # Same peer, multiple addresses
     peer_id = "QmTestPeer123"
-    for i in range(3):
+    addrs = [Multiaddr(f"/ip4/192.168.1.100/tcp/{4001+i}") for i in range(3)]
+    for addr in addrs:
         collector.on_connection_opened(
             peer_id=peer_id,
-            multiaddr=Multiaddr(f"/ip4/192.168.1.100/tcp/{4001+i}"),
+            multiaddr=addr,
             direction="outbound"
         )
     
@@ -1197,9 +1742,13 @@ def _demo_peer_linkability(verbose: bool):
 
 def _demo_anonymity_set(verbose: bool):
     """Demonstrate anonymity set analysis."""
-    click.echo("\n" + "-" * 70)
-    click.echo(click.style("Demo: Anonymity Set Analysis with ZK Proofs", fg="cyan", bold=True))
-    click.echo("-" * 70)
+    from multiaddr import Multiaddr
+
+    from libp2p_privacy_poc.metadata_collector import MetadataCollector
+    from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem
+    from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
+
+    click.echo(_ANONYMITY_DEMO_HEADER)
     click.echo("\nThis demo shows anonymity set analysis and ZK proof generation.")
     
     collector = MetadataCollector()
@@ -1217,16 +1766,16 @@ def _demo_anonymity_set(verbose: bool):
     
     # Generate ZK proof
     zk_system = MockZKProofSystem()
-    peer_ids = list(collector.peers.keys())
+    peer_count = len(collector.peers)
     proof = zk_system.generate_anonymity_set_proof(
-        peer_id=peer_ids[0],
-        anonymity_set_size=len(peer_ids)
+        peer_id=next(iter(collector.peers)),
+        anonymity_set_size=peer_count
     )
     
     click.echo(f"\n{click.style('✓ Anonymity analysis complete', fg='yellow')}")
-    click.echo(f"  • Anonymity set size: {len(peer_ids)}")
+    click.echo(f"  • Anonymity set size: {peer_count}")
     click.echo(f"  • Generated ZK proof: {proof.proof_type}")
-    click.echo(f"  • Proof verified: {click.style('✓', fg='green') if zk_system.verify_proof(proof) else click.style('✗', fg='red')}")
+    click.echo(f"  • Proof verified: {_CHECK if zk_system.verify_proof(proof) else _CROSS}")
 
 
 if __name__ == "__main__":
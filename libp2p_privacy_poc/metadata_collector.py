@@ -11,20 +11,94 @@ Key instrumentation points:
 - Stream creation/closure
 """
 
+import functools
+import heapq
+import json
+import logging
+import sys
 import time
+from operator import attrgetter
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
-from collections import defaultdict
+from typing import Deque, Dict, Iterator, List, Optional, Set, TextIO, TYPE_CHECKING
+from collections import defaultdict, deque
 
+import trio
 from multiaddr import Multiaddr
 from libp2p.peer.id import ID as PeerID
 from libp2p.abc import INetConn, INetStream, INetwork, INotifee
 
+try:
+    import orjson
+except ImportError:  # optional: pip install privacy-protocol-toolkit-p2p[fast]
+    orjson = None
+
 if TYPE_CHECKING:
     from typing import Any
 
+logger = logging.getLogger(__name__)
+
+# Per-connection/per-peer records are kept for the whole capture, so drop
+# their instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_peer_id(peer_id_bytes: bytes) -> str:
+    """Base58-encode a peer ID's multihash bytes (cached per peer)."""
+    return str(PeerID(peer_id_bytes))
+
+
+def _peer_id_str(peer_id) -> str:
+    """
+    String form of a peer ID, as used for all collector keys.
+
+    Accepts a py-libp2p ID or an already-encoded string (simulations pass
+    strings); IDs are encoded once per distinct peer rather than per event.
+    """
+    if isinstance(peer_id, str):
+        return peer_id
+    return _encode_peer_id(peer_id.to_bytes())
+
+
+def _connection_id(peer_id: str, timestamp_start: float) -> str:
+    """Key of a connection in MetadataCollector.connections."""
+    return f"{peer_id}_{timestamp_start}"
+
+
+@functools.lru_cache(maxsize=8192)
+def _transport_type(multiaddr: str) -> str:
+    """
+    Transport type of a multiaddr string, memoized per distinct address.
+
+    The checks run in priority order, so e.g. TCP-carried websockets
+    report "tcp".
+    """
+    if "/tcp/" in multiaddr:
+        return "tcp"
+    elif "/quic/" in multiaddr or "/quic-v1/" in multiaddr:
+        return "quic"
+    elif "/ws/" in multiaddr or "/wss/" in multiaddr:
+        return "websocket"
+    else:
+        return "unknown"
+
+
+def _json_default(obj):
+    """orjson fallback for the set and array fields of collected metadata."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
-@dataclass
+# Closed connections a collector keeps by default, so long-lived collectors
+# don't grow without bound
+DEFAULT_MAX_HISTORY = 10_000
+
+
+@dataclass(**_SLOTS)
 class ConnectionMetadata:
     """
     Metadata about a single connection.
@@ -46,6 +120,15 @@ class ConnectionMetadata:
     is_direct: bool = True
     transport_type: Optional[str] = None
     
+    # Mirror of protocols for O(1) duplicate checks; protocols keeps the
+    # negotiation order for reports
+    _protocol_set: Set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._protocol_set.update(self.protocols)
+    
     def finalize(self):
         """Calculate derived fields when connection ends."""
         if self.timestamp_end:
@@ -69,7 +152,7 @@ class ConnectionMetadata:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PeerMetadata:
     """
     Aggregated metadata about a peer across multiple connections.
@@ -95,6 +178,17 @@ class PeerMetadata:
         }
 
 
+def _conn_multiaddr(conn) -> Optional[Multiaddr]:
+    """
+    Multiaddr of a connection: its own if set, else its raw connection's.
+
+    One getattr per attribute instead of hasattr followed by a second lookup.
+    """
+    return getattr(conn, 'multiaddr', None) or getattr(
+        getattr(conn, 'raw_conn', None), 'multiaddr', None
+    )
+
+
 class PrivacyNotifee(INotifee):
     """
     Network notifee implementation to capture privacy-relevant events.
@@ -128,44 +222,31 @@ class PrivacyNotifee(INotifee):
             # Get peer_id from muxed connection
             peer_id = conn.muxed_conn.peer_id
             
-            # Get multiaddr from the connection itself (or from raw connection)
-            if hasattr(conn, 'multiaddr') and conn.multiaddr:
-                multiaddr = conn.multiaddr
-            elif hasattr(conn, 'raw_conn') and hasattr(conn.raw_conn, 'multiaddr'):
-                multiaddr = conn.raw_conn.multiaddr
-            else:
-                # Avoid peerstore lookups to prevent noisy warnings.
-                multiaddr = None
+            # Avoid peerstore lookups to prevent noisy warnings.
+            multiaddr = _conn_multiaddr(conn)
             
             # Determine direction based on whether we initiated the connection
-            direction = "outbound" if hasattr(conn, 'initiator') and conn.initiator else "inbound"
+            direction = "outbound" if getattr(conn, 'initiator', False) else "inbound"
             
+            peer_id = _peer_id_str(peer_id)
             self.collector.on_connection_opened(peer_id, multiaddr, direction)
-            print(f"[PrivacyNotifee] Connected: {peer_id} via {multiaddr}")
+            logger.debug("[PrivacyNotifee] Connected: %s via %s", peer_id, multiaddr)
         except Exception as e:
-            print(f"[PrivacyNotifee] Error in connected(): {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[PrivacyNotifee] Error in connected(): %s", e)
     
     async def disconnected(self, network: INetwork, conn: INetConn) -> None:
         """Called when a connection is closed."""
         try:
-            peer_id = conn.muxed_conn.peer_id if hasattr(conn, 'muxed_conn') and conn.muxed_conn else None
-            
-            # Get multiaddr from the connection itself
-            multiaddr = None
-            if hasattr(conn, 'multiaddr') and conn.multiaddr:
-                multiaddr = conn.multiaddr
-            elif hasattr(conn, 'raw_conn') and hasattr(conn.raw_conn, 'multiaddr'):
-                multiaddr = conn.raw_conn.multiaddr
-            else:
-                multiaddr = None
+            muxed_conn = getattr(conn, 'muxed_conn', None)
+            peer_id = muxed_conn.peer_id if muxed_conn else None
+            multiaddr = _conn_multiaddr(conn)
             
             if peer_id and multiaddr:
+                peer_id = _peer_id_str(peer_id)
                 self.collector.on_connection_closed(peer_id, multiaddr)
-                print(f"[PrivacyNotifee] Disconnected: {peer_id}")
+                logger.debug("[PrivacyNotifee] Disconnected: %s", peer_id)
         except Exception as e:
-            print(f"[PrivacyNotifee] Error in disconnected(): {e}")
+            logger.error("[PrivacyNotifee] Error in disconnected(): %s", e)
     
     async def listen(self, network: INetwork, multiaddr: Multiaddr) -> None:
         """Called when the node starts listening on a new multiaddr."""
@@ -187,39 +268,64 @@ class MetadataCollector:
     - Stream operations
     
     The collected data is used for privacy analysis and (future) ZK proof generation.
+    
+    The collector is trio-only: connection_event and wait_for_connections()
+    are trio primitives and must be used from the trio event loop that runs
+    the host.
     """
     
-    def __init__(self, libp2p_host=None):
+    def __init__(
+        self,
+        libp2p_host=None,
+        max_history: Optional[int] = DEFAULT_MAX_HISTORY,
+    ):
         """
         Initialize the metadata collector.
         
         Args:
             libp2p_host: Optional py-libp2p host instance to monitor
+            max_history: Cap on retained closed connections; the oldest are
+                dropped (from connection_history and connections) once it is
+                exceeded. None keeps every closed connection.
         """
         self.host = libp2p_host
         
         # Storage for collected metadata
         self.connections: Dict[str, ConnectionMetadata] = {}
         self.peers: Dict[str, PeerMetadata] = {}
-        self.connection_history: List[ConnectionMetadata] = []
+        self.connection_history: Deque[ConnectionMetadata] = deque(maxlen=max_history)
         
-        # Timing data for correlation analysis
-        self.connection_times: List[float] = []
-        self.disconnection_times: List[float] = []
+        # Timing data for correlation analysis, stored as packed doubles so
+        # long captures don't allocate a float object per event
+        self.connection_times = array("d")
+        self.disconnection_times = array("d")
         
         # Protocol usage tracking
         self.protocol_usage: Dict[str, int] = defaultdict(int)
         
         # Session tracking
         self.active_sessions: Set[str] = set()
+        # peer_id -> ids of that peer's open connections, oldest first, so
+        # per-peer events touch only the peer's open connections instead of
+        # scanning every connection ever recorded
+        self._active_by_peer: Dict[str, List[str]] = defaultdict(list)
         
         # Statistics
         self.total_connections = 0
         self.total_disconnections = 0
+        # Bumped by every event handler, so consumers can tell whether the
+        # collected data changed since they last looked
+        self.revision = 0
 
         # Warnings
         self.warnings: List[Dict[str, str]] = []
         self._warned_missing_addrs: Set[str] = set()
+
+        # Set once the first connection has been captured, so callers can
+        # wait for it instead of sleeping for a fixed interval.
+        self.connection_event = trio.Event()
+        # Re-armed on every captured connection; see wait_for_connections().
+        self._connection_captured = trio.Event()
         
         # Setup hooks if host provided
         if self.host:
@@ -240,9 +346,15 @@ class MetadataCollector:
         network = self.host.get_network()
         network.register_notifee(self.notifee)
         
-        print(f"✓ Privacy notifee registered with {network}")
+        logger.info("Privacy notifee registered with %s", network)
     
-    def on_connection_opened(self, peer_id: PeerID, multiaddr: Multiaddr, direction: str):
+    def on_connection_opened(
+        self,
+        peer_id: PeerID,
+        multiaddr: Multiaddr,
+        direction: str,
+        timestamp: Optional[float] = None,
+    ):
         """
         Called when a new connection is opened.
         
@@ -250,8 +362,11 @@ class MetadataCollector:
             peer_id: The peer ID of the remote peer
             multiaddr: The multiaddr of the connection
             direction: "inbound" or "outbound"
+            timestamp: Optional wall-clock open time (defaults to now); lets
+                simulations stamp events without sleeping between them
         """
-        peer_id_str = str(peer_id)
+        self.revision += 1
+        peer_id_str = _peer_id_str(peer_id)
         if multiaddr is None:
             if peer_id_str not in self._warned_missing_addrs:
                 self._warned_missing_addrs.add(peer_id_str)
@@ -264,25 +379,50 @@ class MetadataCollector:
                 )
             multiaddr_str = "unknown"
         else:
-            multiaddr_str = str(multiaddr)
-        connection_id = f"{peer_id_str}_{time.time()}"
+            # Addresses repeat across connections; share one string per
+            # distinct address (the transport types are already literals)
+            multiaddr_str = sys.intern(str(multiaddr))
+        if timestamp is None:
+            timestamp = time.time()
+        connection_id = _connection_id(peer_id_str, timestamp)
         
         # Create connection metadata
         metadata = ConnectionMetadata(
             peer_id=peer_id_str,
             multiaddr=multiaddr_str,
             direction=direction,
-            timestamp_start=time.time(),
-            transport_type=self._extract_transport_type(multiaddr_str)
+            timestamp_start=timestamp,
+            transport_type=_transport_type(multiaddr_str)
         )
         
+        if connection_id not in self.active_sessions:
+            self._active_by_peer[peer_id_str].append(connection_id)
         self.connections[connection_id] = metadata
         self.connection_times.append(metadata.timestamp_start)
         self.total_connections += 1
         self.active_sessions.add(connection_id)
         
         # Update peer metadata
-        self._update_peer_metadata(peer_id_str, multiaddr_str)
+        self._update_peer_metadata(peer_id_str, multiaddr_str, timestamp)
+        self.connection_event.set()
+        self._connection_captured.set()
+        self._connection_captured = trio.Event()
+
+    async def wait_for_connections(self, expected_count: int, timeout: float = 2.0) -> bool:
+        """
+        Wait until at least expected_count connections have been captured.
+        
+        Args:
+            expected_count: Number of opened connections to wait for
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            True if the count was reached, False if the timeout expired first
+        """
+        with trio.move_on_after(timeout):
+            while self.total_connections < expected_count:
+                await self._connection_captured.wait()
+        return self.total_connections >= expected_count
     
     def on_connection_closed(self, peer_id: PeerID, multiaddr: Multiaddr):
         """
@@ -292,28 +432,39 @@ class MetadataCollector:
             peer_id: The peer ID of the remote peer
             multiaddr: The multiaddr of the connection
         """
-        peer_id_str = str(peer_id)
+        self.revision += 1
+        peer_id_str = _peer_id_str(peer_id)
         current_time = time.time()
         
-        # Find and finalize the connection
-        for conn_id, metadata in self.connections.items():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                metadata.timestamp_end = current_time
-                metadata.finalize()
-                
-                # Move to history
-                self.connection_history.append(metadata)
-                self.disconnection_times.append(current_time)
-                self.total_disconnections += 1
-                self.active_sessions.discard(conn_id)
-                
-                # Update peer metadata
-                if peer_id_str in self.peers:
-                    self.peers[peer_id_str].last_seen = current_time
-                    if metadata.connection_duration:
-                        self.peers[peer_id_str].total_duration += metadata.connection_duration
-                
-                break
+        # Finalize the peer's oldest open connection
+        active_ids = self._active_by_peer.get(peer_id_str)
+        if not active_ids:
+            return
+        conn_id = active_ids.pop(0)
+        if not active_ids:
+            del self._active_by_peer[peer_id_str]
+        
+        metadata = self.connections[conn_id]
+        metadata.timestamp_end = current_time
+        metadata.finalize()
+        
+        # Move to history, retiring the oldest record when it is capped
+        history = self.connection_history
+        if history.maxlen is not None and len(history) == history.maxlen:
+            evicted = history[0]
+            evicted_id = _connection_id(evicted.peer_id, evicted.timestamp_start)
+            if self.connections.get(evicted_id) is evicted:
+                del self.connections[evicted_id]
+        history.append(metadata)
+        self.disconnection_times.append(current_time)
+        self.total_disconnections += 1
+        self.active_sessions.discard(conn_id)
+        
+        # Update peer metadata
+        if peer_id_str in self.peers:
+            self.peers[peer_id_str].last_seen = current_time
+            if metadata.connection_duration:
+                self.peers[peer_id_str].total_duration += metadata.connection_duration
     
     def on_protocol_negotiated(self, peer_id: PeerID, protocol: str):
         """
@@ -323,20 +474,23 @@ class MetadataCollector:
             peer_id: The peer ID of the remote peer
             protocol: The protocol identifier
         """
-        peer_id_str = str(peer_id)
+        self.revision += 1
+        peer_id_str = _peer_id_str(peer_id)
+        protocol = sys.intern(protocol)
         
         # Track protocol usage
         self.protocol_usage[protocol] += 1
         
         # Update connection metadata
-        for metadata in self.connections.values():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                if protocol not in metadata.protocols:
-                    metadata.protocols.append(protocol)
+        for metadata in self._active_connections_of(peer_id_str):
+            if protocol not in metadata._protocol_set:
+                metadata._protocol_set.add(protocol)
+                metadata.protocols.append(protocol)
         
         # Update peer metadata
-        if peer_id_str in self.peers:
-            self.peers[peer_id_str].protocols.add(protocol)
+        peer = self.peers.get(peer_id_str)
+        if peer is not None:
+            peer.protocols.add(protocol)
     
     def on_stream_opened(self, peer_id: PeerID):
         """
@@ -345,12 +499,12 @@ class MetadataCollector:
         Args:
             peer_id: The peer ID of the remote peer
         """
-        peer_id_str = str(peer_id)
+        self.revision += 1
+        peer_id_str = _peer_id_str(peer_id)
         
         # Update stream count in active connections
-        for metadata in self.connections.values():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                metadata.stream_count += 1
+        for metadata in self._active_connections_of(peer_id_str):
+            metadata.stream_count += 1
     
     def record_data_transfer(self, peer_id: PeerID, bytes_sent: int, bytes_received: int):
         """
@@ -361,40 +515,42 @@ class MetadataCollector:
             bytes_sent: Number of bytes sent
             bytes_received: Number of bytes received
         """
-        peer_id_str = str(peer_id)
+        self.revision += 1
+        peer_id_str = _peer_id_str(peer_id)
         
         # Update active connections
-        for metadata in self.connections.values():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                metadata.bytes_sent += bytes_sent
-                metadata.bytes_received += bytes_received
+        for metadata in self._active_connections_of(peer_id_str):
+            metadata.bytes_sent += bytes_sent
+            metadata.bytes_received += bytes_received
     
-    def _update_peer_metadata(self, peer_id: str, multiaddr: str):
-        """Update aggregated peer metadata."""
-        current_time = time.time()
+    def _active_connections_of(self, peer_id: str) -> Iterator[ConnectionMetadata]:
+        """
+        Yield the open connections of one peer, oldest first.
         
-        if peer_id not in self.peers:
-            self.peers[peer_id] = PeerMetadata(
+        Lazy, so the per-event handlers don't build a list per call; callers
+        must not open or close connections while iterating.
+        """
+        connections = self.connections
+        for conn_id in self._active_by_peer.get(peer_id, ()):
+            yield connections[conn_id]
+    
+    def _update_peer_metadata(self, peer_id: str, multiaddr: str, current_time: float):
+        """Update aggregated peer metadata for a connection opened at current_time."""
+        peer = self.peers.get(peer_id)
+        if peer is None:
+            peer = self.peers[peer_id] = PeerMetadata(
                 peer_id=peer_id,
                 first_seen=current_time,
                 last_seen=current_time
             )
         
-        peer = self.peers[peer_id]
         peer.connection_count += 1
         peer.last_seen = current_time
         peer.multiaddrs.add(multiaddr)
     
     def _extract_transport_type(self, multiaddr: str) -> str:
         """Extract transport type from multiaddr."""
-        if "/tcp/" in multiaddr:
-            return "tcp"
-        elif "/quic/" in multiaddr or "/quic-v1/" in multiaddr:
-            return "quic"
-        elif "/ws/" in multiaddr or "/wss/" in multiaddr:
-            return "websocket"
-        else:
-            return "unknown"
+        return _transport_type(multiaddr)
     
     def get_active_connections(self) -> List[ConnectionMetadata]:
         """Get all currently active connections."""
@@ -413,15 +569,11 @@ class MetadataCollector:
         Returns:
             List of connection metadata, most recent first
         """
-        history = sorted(
-            self.connection_history,
-            key=lambda x: x.timestamp_start,
-            reverse=True
-        )
-        
+        key = attrgetter("timestamp_start")
         if limit:
-            return history[:limit]
-        return history
+            # Same order as the full sort, in O(N log limit)
+            return heapq.nlargest(limit, self.connection_history, key=key)
+        return sorted(self.connection_history, key=key, reverse=True)
     
     def get_peer_metadata(self, peer_id: str) -> Optional[PeerMetadata]:
         """Get metadata for a specific peer."""
@@ -432,11 +584,17 @@ class MetadataCollector:
         return list(self.peers.values())
     
     def get_statistics(self) -> dict:
-        """Get overall statistics."""
+        """
+        Get overall statistics.
+
+        All values are maintained incrementally by the event handlers, so this
+        is O(1) regardless of how many connections have been recorded.
+        """
         return {
             "total_connections": self.total_connections,
             "total_disconnections": self.total_disconnections,
-            "active_connections": len(self.get_active_connections()),
+            # active_sessions holds exactly the ids of unclosed connections
+            "active_connections": len(self.active_sessions),
             "unique_peers": len(self.peers),
             "protocols_used": len(self.protocol_usage),
             "total_connection_history": len(self.connection_history),
@@ -451,26 +609,117 @@ class MetadataCollector:
         """
         return {
             "statistics": self.get_statistics(),
-            "active_connections": [conn.to_dict() for conn in self.get_active_connections()],
-            "connection_history": [conn.to_dict() for conn in self.connection_history],
-            "peers": [peer.to_dict() for peer in self.peers.values()],
+            "active_connections": list(self.iter_active_connections()),
+            "connection_history": list(self.iter_connection_history()),
+            "peers": list(self.iter_peers()),
             "protocol_usage": dict(self.protocol_usage),
             "warnings": list(self.warnings),
+            "connection_times": self.connection_times.tolist(),
+            "disconnection_times": self.disconnection_times.tolist(),
+        }
+
+    def export_json(self) -> bytes:
+        """
+        Export all collected data as UTF-8 JSON, same document as export_data().
+        
+        With orjson installed the dataclass records are serialized directly,
+        without an intermediate to_dict() per record (underscore fields such
+        as ConnectionMetadata._protocol_set are skipped by orjson). Falls back
+        to json.dumps(export_data()) otherwise.
+        """
+        if orjson is None:
+            return json.dumps(self.export_data()).encode("utf-8")
+        return orjson.dumps(
+            {
+                "statistics": self.get_statistics(),
+                "active_connections": self.get_active_connections(),
+                "connection_history": list(self.connection_history),
+                "peers": list(self.peers.values()),
+                "protocol_usage": dict(self.protocol_usage),
+                "warnings": list(self.warnings),
+                "connection_times": self.connection_times,
+                "disconnection_times": self.disconnection_times,
+            },
+            default=_json_default,
+        )
+
+    def iter_active_connections(self) -> Iterator[dict]:
+        """Yield serialized active connections one at a time."""
+        for conn in self.connections.values():
+            if conn.timestamp_end is None:
+                yield conn.to_dict()
+
+    def iter_connection_history(self) -> Iterator[dict]:
+        """Yield serialized closed connections one at a time."""
+        for conn in self.connection_history:
+            yield conn.to_dict()
+
+    def iter_peers(self) -> Iterator[dict]:
+        """Yield serialized peer metadata one at a time."""
+        for peer in self.peers.values():
+            yield peer.to_dict()
+
+    def dump_json(self, fp: TextIO) -> None:
+        """
+        Write export_data() as JSON to a file object without building it.
+        
+        Connection and peer records are serialized one at a time, so only
+        one record's dict is alive at once.
+        
+        Args:
+            fp: Writable text file object
+        """
+        sections = {
+            "statistics": self.get_statistics(),
+            "active_connections": self.iter_active_connections(),
+            "connection_history": self.iter_connection_history(),
+            "peers": self.iter_peers(),
+            "protocol_usage": dict(self.protocol_usage),
+            "warnings": self.warnings,
             "connection_times": self.connection_times,
             "disconnection_times": self.disconnection_times,
         }
+        fp.write("{")
+        for index, (name, value) in enumerate(sections.items()):
+            if index:
+                fp.write(", ")
+            fp.write(f"{json.dumps(name)}: ")
+            if isinstance(value, dict):
+                json.dump(value, fp)
+                continue
+            fp.write("[")
+            for item_index, item in enumerate(value):
+                if item_index:
+                    fp.write(", ")
+                json.dump(item, fp)
+            fp.write("]")
+        fp.write("}")
 
     def get_warnings(self) -> List[Dict[str, str]]:
         return list(self.warnings)
     
     def clear(self):
-        """Clear all collected metadata."""
+        """
+        Clear all collected metadata.
+        
+        Tasks waiting on the previous connection_event are woken; callers
+        should re-read the collector afterwards rather than assume a
+        connection arrived.
+        """
         self.connections.clear()
         self.peers.clear()
         self.connection_history.clear()
-        self.connection_times.clear()
-        self.disconnection_times.clear()
+        del self.connection_times[:]
+        del self.disconnection_times[:]
         self.protocol_usage.clear()
         self.active_sessions.clear()
+        self._active_by_peer.clear()
         self.total_connections = 0
         self.total_disconnections = 0
+        self.revision += 1
+        # Wake anything waiting on the old events before replacing them, so
+        # no task is left blocked on an event that can no longer fire
+        self.connection_event.set()
+        self.connection_event = trio.Event()
+        self._connection_captured.set()
+        self._connection_captured = trio.Event()
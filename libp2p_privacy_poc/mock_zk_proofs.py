@@ -369,7 +369,26 @@ class MockZKProofSystem:
         Returns:
             True if all proofs verify
         """
-        return all(self.verify_proof(proof) for proof in proofs)
+        return all(self.verify_batch(proofs))
+
+    def verify_batch(self, proofs: List[MockZKProof]) -> List[bool]:
+        """
+        Mock batch verification with per-proof results.
+        
+        ⚠️ MOCK IMPLEMENTATION
+        
+        Real implementation would:
+        1. Combine the Groth16 pairing checks with random linear coefficients
+        2. Evaluate them with one multi-scalar multiplication
+        3. Fall back to per-proof checks only when the batch fails
+        
+        Args:
+            proofs: List of proofs to verify
+        
+        Returns:
+            Verification result for each proof, in input order
+        """
+        return [self.verify_proof(proof) for proof in proofs]
     
     def get_proof_statistics(self) -> dict:
         """Get statistics about generated proofs."""
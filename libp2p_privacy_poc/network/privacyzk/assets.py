@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Dict, Tuple
 
 from .constants import (
     DEFAULT_MEMBERSHIP_DEPTH,
@@ -19,6 +20,31 @@ from .errors import SchemaError, SizeLimitError
 
 MAX_VK_BYTES = 1024 * 1024
 
+# Accepted file names per statement and artifact, in priority order
+_CANDIDATES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "membership": {
+        "vk": ("membership_vk.bin", "vk.bin"),
+        "public_inputs": ("public_inputs.bin", "membership_public_inputs.bin"),
+        "proof": ("membership_proof.bin", "proof.bin"),
+        "pk": ("pk.bin", "membership_pk.bin"),
+        "instance": ("instance.bin", "membership_instance.bin"),
+    },
+    "continuity": {
+        "vk": ("continuity_vk.bin", "vk.bin"),
+        "public_inputs": ("continuity_public_inputs.bin", "public_inputs.bin"),
+        "proof": ("continuity_proof.bin", "proof.bin"),
+        "pk": ("pk.bin", "continuity_pk.bin"),
+        "instance": ("instance.bin", "continuity_instance.bin"),
+    },
+    "unlinkability": {
+        "vk": ("unlinkability_vk.bin", "vk.bin"),
+        "public_inputs": ("unlinkability_public_inputs.bin", "public_inputs.bin"),
+        "proof": ("unlinkability_proof.bin", "proof.bin"),
+        "pk": ("pk.bin", "unlinkability_pk.bin"),
+        "instance": ("instance.bin", "unlinkability_instance.bin"),
+    },
+}
+
 
 @dataclass(frozen=True)
 class FixturePaths:
@@ -37,53 +63,80 @@ class ProverPaths:
 class AssetsResolver:
     def __init__(self, base_dir: Path | str = "privacy_circuits/params") -> None:
         self._base_dir = Path(base_dir)
+        # Successful resolutions per (statement, schema, depth), so repeated
+        # requests skip the directory scan and size checks. Fixture files are
+        # treated as immutable for the life of the resolver; create a new one
+        # or call clear_cache() after changing them.
+        self._fixtures: Dict[Tuple[str, int, int], FixturePaths] = {}
+        self._prover_inputs: Dict[Tuple[str, int, int], ProverPaths] = {}
 
     def resolve_fixture(
         self, statement_type: str, schema_v: int, depth: int
     ) -> FixturePaths:
         self._validate_request(statement_type, schema_v, depth)
+        key = (statement_type, schema_v, depth)
+        fixture = self._fixtures.get(key)
+        if fixture is None:
+            fixture = self._find_fixture(statement_type, schema_v, depth)
+            self._fixtures[key] = fixture
+        return fixture
+
+    def resolve_prover_inputs(
+        self, statement_type: str, schema_v: int, depth: int
+    ) -> ProverPaths:
+        self._validate_request(statement_type, schema_v, depth)
+        key = (statement_type, schema_v, depth)
+        paths = self._prover_inputs.get(key)
+        if paths is None:
+            paths = self._find_prover_inputs(statement_type, schema_v, depth)
+            self._prover_inputs[key] = paths
+        return paths
+
+    def clear_cache(self) -> None:
+        """Forget cached resolutions, e.g. after replacing fixture files."""
+        self._fixtures.clear()
+        self._prover_inputs.clear()
+
+    def _find_fixture(
+        self, statement_type: str, schema_v: int, depth: int
+    ) -> FixturePaths:
         base = self._base_dir / statement_type / f"v{schema_v}" / f"depth-{depth}"
-        if not base.exists() or not base.is_dir():
-            raise SchemaError(f"fixture directory missing: {base}")
+        files = self._scan_files(base, "fixture")
+        candidates = _CANDIDATES[statement_type]
 
-        vk_path = self._resolve_one(base, self._vk_candidates(statement_type), "vk")
-        public_inputs_path = self._resolve_one(
-            base, self._public_inputs_candidates(statement_type), "public_inputs"
-        )
-        proof_path = self._resolve_one(base, self._proof_candidates(statement_type), "proof")
+        vk = self._resolve_one(base, files, candidates, "vk")
+        public_inputs = self._resolve_one(base, files, candidates, "public_inputs")
+        proof = self._resolve_one(base, files, candidates, "proof")
 
-        self._check_size(vk_path, MAX_VK_BYTES, "vk")
-        self._check_size(public_inputs_path, MAX_PUBLIC_INPUTS_BYTES, "public_inputs")
-        self._check_size(proof_path, MAX_PROOF_BYTES, "proof")
+        self._check_size(vk, MAX_VK_BYTES, "vk")
+        self._check_size(public_inputs, MAX_PUBLIC_INPUTS_BYTES, "public_inputs")
+        self._check_size(proof, MAX_PROOF_BYTES, "proof")
 
         return FixturePaths(
-            vk_path=vk_path, public_inputs_path=public_inputs_path, proof_path=proof_path
+            vk_path=Path(vk.path),
+            public_inputs_path=Path(public_inputs.path),
+            proof_path=Path(proof.path),
         )
 
-    def resolve_prover_inputs(
+    def _find_prover_inputs(
         self, statement_type: str, schema_v: int, depth: int
     ) -> ProverPaths:
-        self._validate_request(statement_type, schema_v, depth)
         base = self._base_dir / statement_type / f"v{schema_v}" / f"depth-{depth}"
-        if not base.exists() or not base.is_dir():
-            raise SchemaError(f"prover directory missing: {base}")
+        files = self._scan_files(base, "prover")
+        candidates = _CANDIDATES[statement_type]
 
-        pk_path = self._resolve_one(base, self._pk_candidates(statement_type), "pk")
-        instance_path = self._resolve_one(
-            base, self._instance_candidates(statement_type), "instance"
-        )
-        public_inputs_path = self._resolve_one(
-            base, self._public_inputs_candidates(statement_type), "public_inputs"
-        )
+        pk = self._resolve_one(base, files, candidates, "pk")
+        instance = self._resolve_one(base, files, candidates, "instance")
+        public_inputs = self._resolve_one(base, files, candidates, "public_inputs")
 
-        self._check_size(pk_path, MAX_PK_BYTES, "pk")
-        self._check_size(instance_path, MAX_INSTANCE_BYTES, "instance")
-        self._check_size(public_inputs_path, MAX_PUBLIC_INPUTS_BYTES, "public_inputs")
+        self._check_size(pk, MAX_PK_BYTES, "pk")
+        self._check_size(instance, MAX_INSTANCE_BYTES, "instance")
+        self._check_size(public_inputs, MAX_PUBLIC_INPUTS_BYTES, "public_inputs")
 
         return ProverPaths(
-            pk_path=pk_path,
-            instance_path=instance_path,
-            public_inputs_path=public_inputs_path,
+            pk_path=Path(pk.path),
+            instance_path=Path(instance.path),
+            public_inputs_path=Path(public_inputs.path),
         )
 
     def _validate_request(self, statement_type: str, schema_v: int, depth: int) -> None:
@@ -98,56 +151,29 @@ class AssetsResolver:
             if depth != 0:
                 raise SchemaError("unsupported depth for statement")
 
+    @staticmethod
+    def _scan_files(base: Path, kind: str) -> Dict[str, os.DirEntry]:
+        """List the regular files in base with one scandir pass."""
+        try:
+            with os.scandir(base) as entries:
+                return {entry.name: entry for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            raise SchemaError(f"{kind} directory missing: {base}") from None
+
     def _resolve_one(
-        self, base: Path, candidates: Iterable[str], label: str
-    ) -> Path:
-        for name in candidates:
-            path = base / name
-            if path.exists() and path.is_file():
-                return path
+        self,
+        base: Path,
+        files: Dict[str, os.DirEntry],
+        candidates: Dict[str, Tuple[str, ...]],
+        label: str,
+    ) -> os.DirEntry:
+        for name in candidates[label]:
+            entry = files.get(name)
+            if entry is not None:
+                return entry
         raise SchemaError(f"missing {label} fixture in {base}")
 
-    def _check_size(self, path: Path, limit: int, label: str) -> None:
-        size = path.stat().st_size
+    def _check_size(self, entry: os.DirEntry, limit: int, label: str) -> None:
+        size = entry.stat().st_size
         if size > limit:
             raise SizeLimitError(f"{label} size exceeds limit")
-
-    @staticmethod
-    def _vk_candidates(statement_type: str) -> tuple[str, ...]:
-        if statement_type == "membership":
-            return ("membership_vk.bin", "vk.bin")
-        if statement_type == "continuity":
-            return ("continuity_vk.bin", "vk.bin")
-        return ("unlinkability_vk.bin", "vk.bin")
-
-    @staticmethod
-    def _public_inputs_candidates(statement_type: str) -> tuple[str, ...]:
-        if statement_type == "membership":
-            return ("public_inputs.bin", "membership_public_inputs.bin")
-        if statement_type == "continuity":
-            return ("continuity_public_inputs.bin", "public_inputs.bin")
-        return ("unlinkability_public_inputs.bin", "public_inputs.bin")
-
-    @staticmethod
-    def _proof_candidates(statement_type: str) -> tuple[str, ...]:
-        if statement_type == "membership":
-            return ("membership_proof.bin", "proof.bin")
-        if statement_type == "continuity":
-            return ("continuity_proof.bin", "proof.bin")
-        return ("unlinkability_proof.bin", "proof.bin")
-
-    @staticmethod
-    def _pk_candidates(statement_type: str) -> tuple[str, ...]:
-        if statement_type == "membership":
-            return ("pk.bin", "membership_pk.bin")
-        if statement_type == "continuity":
-            return ("pk.bin", "continuity_pk.bin")
-        return ("pk.bin", "unlinkability_pk.bin")
-
-    @staticmethod
-    def _instance_candidates(statement_type: str) -> tuple[str, ...]:
-        if statement_type == "membership":
-            return ("instance.bin", "membership_instance.bin")
-        if statement_type == "continuity":
-            return ("instance.bin", "continuity_instance.bin")
-        return ("instance.bin", "unlinkability_instance.bin")
@@ -53,6 +53,62 @@ def try_real_proofs(
     offline: bool = False,
     require_real: bool = False,
 ) -> ProofExchangeResult:
+    plan = _plan_exchange(collector, statement, statements, zk_peer, offline)
+    if isinstance(plan, ProofExchangeResult):
+        return plan
+    peer_id, peer_addr, normalized = plan
+
+    try:
+        results = _exchange(
+            peer_id,
+            peer_addr,
+            normalized,
+            assets_dir,
+            timeout,
+        )
+    except Exception as exc:
+        return _exchange_failed(statement, peer_id, peer_addr, normalized, exc)
+    return _finish_exchange(peer_addr, normalized, results, require_real)
+
+
+async def try_real_proofs_async(
+    collector: Any,
+    *,
+    statement: str = "membership",
+    statements: Optional[Iterable[str]] = None,
+    assets_dir: str = "privacy_circuits/params",
+    timeout: float = 8.0,
+    zk_peer: Optional[str] = None,
+    offline: bool = False,
+    require_real: bool = False,
+) -> ProofExchangeResult:
+    """Like try_real_proofs(), but runs in the caller's trio event loop."""
+    plan = _plan_exchange(collector, statement, statements, zk_peer, offline)
+    if isinstance(plan, ProofExchangeResult):
+        return plan
+    peer_id, peer_addr, normalized = plan
+
+    try:
+        results = await _exchange_async(
+            peer_id,
+            peer_addr,
+            normalized,
+            assets_dir,
+            timeout,
+        )
+    except Exception as exc:
+        return _exchange_failed(statement, peer_id, peer_addr, normalized, exc)
+    return _finish_exchange(peer_addr, normalized, results, require_real)
+
+
+def _plan_exchange(
+    collector: Any,
+    statement: str,
+    statements: Optional[Iterable[str]],
+    zk_peer: Optional[str],
+    offline: bool,
+) -> ProofExchangeResult | Tuple[str, Optional[str], List[str]]:
+    """Pick the peer and statements, or return the result if there is no exchange."""
     if offline:
         return ProofExchangeResult(False, False, [], None)
 
@@ -74,25 +130,32 @@ def try_real_proofs(
             "unsupported statement",
             summary=_build_summary(peer_addr, normalized, []),
         )
+    return peer_id, peer_addr, normalized
 
-    try:
-        results = _exchange(
-            peer_id,
-            peer_addr,
-            normalized,
-            assets_dir,
-            timeout,
-        )
-    except Exception as exc:
-        results = [_error_result(statement, peer_id, str(exc))]
-        return ProofExchangeResult(
-            True,
-            False,
-            results,
-            "Real ZK proof exchange unavailable; falling back to legacy simulation.",
-            summary=_build_summary(peer_addr, normalized, results),
-        )
 
+def _exchange_failed(
+    statement: str,
+    peer_id: str,
+    peer_addr: Optional[str],
+    normalized: List[str],
+    exc: Exception,
+) -> ProofExchangeResult:
+    results = [_error_result(statement, peer_id, str(exc))]
+    return ProofExchangeResult(
+        True,
+        False,
+        results,
+        "Real ZK proof exchange unavailable; falling back to legacy simulation.",
+        summary=_build_summary(peer_addr, normalized, results),
+    )
+
+
+def _finish_exchange(
+    peer_addr: Optional[str],
+    normalized: List[str],
+    results: List[Dict[str, Any]],
+    require_real: bool,
+) -> ProofExchangeResult:
     if require_real:
         for item in results:
             if item.get("prove_mode") != "real":
@@ -214,16 +277,17 @@ async def _exchange_async(
                     results.append(result)
                     continue
                 fixture = resolver.resolve_fixture(statement, SNARK_SCHEMA_V, depth)
+                vk = fixture.vk_path.read_bytes()
                 result["asset_source"] = {
                     "type": "vk",
                     "path": str(fixture.vk_path),
-                    "sha256": _hash_file(fixture.vk_path),
+                    "sha256": hashlib.sha256(vk).hexdigest(),
                 }
                 verify_start = time.perf_counter()
                 verified = SnarkBackend.verify(
                     statement_type=statement,
                     schema_version=SNARK_SCHEMA_V,
-                    vk=str(fixture.vk_path),
+                    vk=vk,
                     public_inputs=response.public_inputs,
                     proof=response.proof,
                 )
@@ -326,14 +390,6 @@ def _error_result(statement: str, peer_id: str, message: str) -> Dict[str, Any]:
     }
 
 
-def _hash_file(path: Any) -> str:
-    try:
-        data = path.read_bytes()
-    except Exception:
-        return ""
-    return hashlib.sha256(data).hexdigest()
-
-
 def _build_summary(
     peer_addr: Optional[str],
     statements: Iterable[str],
@@ -60,14 +60,15 @@ class FixtureProofProvider:
     def __init__(self, config: ProviderConfig) -> None:
         self._config = config
         self._resolver = AssetsResolver(config.base_dir)
+        # (statement, schema_v, depth) -> (public_inputs, proof, encoded meta);
+        # fixtures are static for the life of a server
+        self._loaded: dict[tuple[str, int, int], tuple[bytes, bytes, bytes]] = {}
 
-    def get_proof(self, req: ProofRequest) -> ProofResponse:
-        try:
-            _validate_request(req, self._config.strict)
+    def _load_fixture(self, req: ProofRequest) -> tuple[bytes, bytes, bytes]:
+        key = (req.t, req.schema_v, req.d)
+        loaded = self._loaded.get(key)
+        if loaded is None:
             fixture = self._resolver.resolve_fixture(req.t, req.schema_v, req.d)
-            public_inputs = fixture.public_inputs_path.read_bytes()
-            proof = fixture.proof_path.read_bytes()
-
             meta = {
                 "prove_mode": "fixture",
                 "statement": req.t,
@@ -77,6 +78,18 @@ class FixtureProofProvider:
                 "public_inputs_path": str(fixture.public_inputs_path),
                 "proof_path": str(fixture.proof_path),
             }
+            loaded = (
+                fixture.public_inputs_path.read_bytes(),
+                fixture.proof_path.read_bytes(),
+                _encode_meta(meta),
+            )
+            self._loaded[key] = loaded
+        return loaded
+
+    def get_proof(self, req: ProofRequest) -> ProofResponse:
+        try:
+            _validate_request(req, self._config.strict)
+            public_inputs, proof, meta_bytes = self._load_fixture(req)
             return ProofResponse(
                 msg_v=req.msg_v,
                 ok=True,
@@ -85,7 +98,7 @@ class FixtureProofProvider:
                 d=req.d,
                 public_inputs=public_inputs,
                 proof=proof,
-                meta=_encode_meta(meta),
+                meta=meta_bytes,
                 err=None,
             )
         except (SchemaError, SizeLimitError) as exc:
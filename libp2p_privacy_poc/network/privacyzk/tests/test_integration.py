@@ -124,3 +124,35 @@ def test_try_real_proofs_require_real_rejects_fixture(
     assert result.success is False
     assert result.results[0]["verified"] is False
     assert "prove_mode" in (result.results[0]["error"] or "")
+
+
+def test_try_real_proofs_async_uses_running_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import trio
+
+    async def _exchange_async(peer_id, peer_addr, statements, assets_dir, timeout):
+        await trio.sleep(0)
+        return [
+            {
+                "backend": "snark-network",
+                "statement": f"{statement}_v2",
+                "peer_id": peer_id,
+                "verified": True,
+                "error": None,
+            }
+            for statement in statements
+        ]
+
+    monkeypatch.setattr(integration, "_exchange_async", _exchange_async)
+    result = trio.run(
+        lambda: integration.try_real_proofs_async(
+            _make_collector(), statements=["membership", "continuity"]
+        )
+    )
+    assert result.attempted is True
+    assert result.success is True
+    assert [item["statement"] for item in result.results] == [
+        "membership_v2",
+        "continuity_v2",
+    ]
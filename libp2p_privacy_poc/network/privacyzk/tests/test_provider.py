@@ -7,6 +7,7 @@ from pathlib import Path
 import cbor2
 import pytest
 
+from libp2p_privacy_poc.network.privacyzk.assets import AssetsResolver
 from libp2p_privacy_poc.network.privacyzk.constants import (
     DEFAULT_MEMBERSHIP_DEPTH,
     MAX_PROOF_BYTES,
@@ -14,6 +15,7 @@ from libp2p_privacy_poc.network.privacyzk.constants import (
     MSG_V,
     SNARK_SCHEMA_V,
 )
+from libp2p_privacy_poc.network.privacyzk.errors import SchemaError, SizeLimitError
 from libp2p_privacy_poc.network.privacyzk.messages import ProofRequest
 from libp2p_privacy_poc.network.privacyzk.provider import (
     FixtureProofProvider,
@@ -54,6 +56,23 @@ def test_fixture_provider_happy_path_membership(tmp_path: Path) -> None:
     assert meta["statement"] == "membership"
 
 
+def test_fixture_provider_reads_each_fixture_once(tmp_path: Path) -> None:
+    base = tmp_path / "membership" / "v2" / f"depth-{DEFAULT_MEMBERSHIP_DEPTH}"
+    _write_fixture(base, "membership_vk.bin", b"vk")
+    _write_fixture(base, "public_inputs.bin", b"pi")
+    _write_fixture(base, "membership_proof.bin", b"proof")
+
+    config = ProviderConfig(prove_mode="fixture", base_dir=str(tmp_path))
+    provider = FixtureProofProvider(config)
+    first = provider.get_proof(_membership_req())
+    (base / "membership_proof.bin").unlink()
+    second = provider.get_proof(_membership_req())
+
+    assert second.ok is True
+    assert second.proof == first.proof == b"proof"
+    assert second.meta == first.meta
+
+
 def test_fixture_provider_missing_files_returns_ok_false(tmp_path: Path) -> None:
     base = tmp_path / "membership" / "v2" / f"depth-{DEFAULT_MEMBERSHIP_DEPTH}"
     _write_fixture(base, "membership_vk.bin", b"vk")
@@ -67,6 +86,28 @@ def test_fixture_provider_missing_files_returns_ok_false(tmp_path: Path) -> None
     assert resp.err
 
 
+def test_assets_resolver_caches_successful_resolution(tmp_path: Path) -> None:
+    base = tmp_path / "membership" / "v2" / f"depth-{DEFAULT_MEMBERSHIP_DEPTH}"
+    args = ("membership", SNARK_SCHEMA_V, DEFAULT_MEMBERSHIP_DEPTH)
+
+    with pytest.raises(SchemaError):
+        AssetsResolver(tmp_path).resolve_fixture(*args)
+
+    _write_fixture(base, "membership_vk.bin", b"vk")
+    _write_fixture(base, "public_inputs.bin", b"pi")
+    _write_fixture(base, "membership_proof.bin", b"proof")
+
+    resolver = AssetsResolver(tmp_path)
+    first = resolver.resolve_fixture(*args)
+    assert first.vk_path == base / "membership_vk.bin"
+    assert resolver.resolve_fixture(*args) is first
+
+    _write_fixture(base, "membership_proof.bin", b"p" * (MAX_PROOF_BYTES + 1))
+    resolver.clear_cache()
+    with pytest.raises(SizeLimitError):
+        resolver.resolve_fixture(*args)
+
+
 def test_fixture_provider_rejects_oversized_public_inputs(tmp_path: Path) -> None:
     base = tmp_path / "membership" / "v2" / f"depth-{DEFAULT_MEMBERSHIP_DEPTH}"
     _write_fixture(base, "membership_vk.bin", b"vk")
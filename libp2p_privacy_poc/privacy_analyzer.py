@@ -11,14 +11,20 @@ Key analysis capabilities:
 - Privacy risk scoring
 """
 
+import bisect
 import statistics
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict, Counter
 
 from libp2p_privacy_poc.metadata_collector import MetadataCollector, ConnectionMetadata, PeerMetadata
 
 
+# Risk level lookup: score cut points and the label above each cut
+_RISK_LEVEL_CUTS = (0.25, 0.5, 0.75)
+_RISK_LEVEL_LABELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+
 @dataclass
 class PrivacyRisk:
     """Represents a detected privacy risk."""
@@ -111,14 +117,9 @@ class PrivacyReport:
         - MEDIUM: >= 0.25
         - LOW: < 0.25
         """
-        if self.overall_risk_score >= 0.75:
-            return "CRITICAL"
-        elif self.overall_risk_score >= 0.5:
-            return "HIGH"
-        elif self.overall_risk_score >= 0.25:
-            return "MEDIUM"
-        else:
-            return "LOW"
+        return _RISK_LEVEL_LABELS[
+            bisect.bisect_right(_RISK_LEVEL_CUTS, self.overall_risk_score)
+        ]
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -134,6 +135,19 @@ class PrivacyReport:
         }
 
 
+def _copy_report(report: PrivacyReport, timestamp: float) -> PrivacyReport:
+    """Copy a report's containers (not the risks in them) with a new timestamp."""
+    return replace(
+        report,
+        timestamp=timestamp,
+        risks=list(report.risks),
+        statistics=dict(report.statistics),
+        peer_analysis=dict(report.peer_analysis),
+        timing_analysis=dict(report.timing_analysis),
+        recommendations=list(report.recommendations),
+    )
+
+
 class PrivacyAnalyzer:
     """
     Analyzes privacy risks in py-libp2p networks.
@@ -159,22 +173,52 @@ class PrivacyAnalyzer:
         self.LINKABILITY_THRESHOLD = 0.6
         self.MIN_ANONYMITY_SET_SIZE = 10
         
-    def analyze(self) -> PrivacyReport:
+        # Last report and the collector revision/thresholds it was built from
+        self._cached_key = None
+        self._cached_report: Optional[PrivacyReport] = None
+        
+    def analyze(self, stats: Optional[dict] = None) -> PrivacyReport:
         """
         Perform comprehensive privacy analysis.
         
+        Repeated calls reuse the previous analysis while the collector has
+        recorded no new events, the thresholds are unchanged and any given
+        stats match it. Each call returns its own shallow copy with a
+        fresh timestamp, so callers may modify the report they get.
+        
+        Args:
+            stats: Optional snapshot from collector.get_statistics() that
+                the caller already holds; fetched from the collector if omitted
+        
         Returns:
             PrivacyReport with detected risks and recommendations
         """
         import time
         
+        revision = getattr(self.collector, "revision", None)
+        key = None
+        if revision is not None:
+            key = (
+                revision,
+                self.TIMING_CORRELATION_THRESHOLD,
+                self.LINKABILITY_THRESHOLD,
+                self.MIN_ANONYMITY_SET_SIZE,
+            )
+            cached = self._cached_report
+            if key == self._cached_key and (
+                stats is None or stats == cached.statistics
+            ):
+                return _copy_report(cached, timestamp=time.time())
+        
         report = PrivacyReport(
             timestamp=time.time(),
             overall_risk_score=0.0  # Will be calculated later
         )
         
         # Collect statistics
-        report.statistics = self.collector.get_statistics()
+        if stats is None:
+            stats = self.collector.get_statistics()
+        report.statistics = stats
         
         # Run all analysis modules
         report.risks.extend(self._analyze_peer_linkability())
@@ -196,6 +240,8 @@ class PrivacyAnalyzer:
         # Generate recommendations
         report.recommendations = self._generate_recommendations(report.risks)
         
+        self._cached_key = key
+        self._cached_report = _copy_report(report, timestamp=report.timestamp)
         return report
     
     def _analyze_peer_linkability(self) -> List[PrivacyRisk]:
@@ -265,11 +311,7 @@ class PrivacyAnalyzer:
         if len(self.collector.connection_times) < 3:
             return risks
         
-        # Calculate inter-connection intervals
-        intervals = []
-        for i in range(1, len(self.collector.connection_times)):
-            interval = self.collector.connection_times[i] - self.collector.connection_times[i-1]
-            intervals.append(interval)
+        intervals = self._connection_intervals()
         
         if not intervals:
             return risks
@@ -408,8 +450,6 @@ class PrivacyAnalyzer:
         """
         risks = []
         
-        stats = self.collector.get_statistics()
-        
         # Check for imbalanced connection directions
         active_conns = self.collector.get_active_connections()
         if active_conns:
@@ -469,15 +509,17 @@ class PrivacyAnalyzer:
         
         return min(score, 1.0)
     
+    def _connection_intervals(self) -> List[float]:
+        """Gaps between consecutive connection times, in capture order."""
+        times = self.collector.connection_times
+        return [later - earlier for earlier, later in zip(times, times[1:])]
+    
     def _analyze_timing_patterns(self) -> dict:
         """Analyze timing patterns in connections."""
         if len(self.collector.connection_times) < 2:
             return {}
         
-        intervals = []
-        for i in range(1, len(self.collector.connection_times)):
-            interval = self.collector.connection_times[i] - self.collector.connection_times[i-1]
-            intervals.append(interval)
+        intervals = self._connection_intervals()
         
         if not intervals:
             return {}
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Mapping
+from typing import Iterable, Mapping
 
 
 @dataclass(frozen=True)
@@ -72,15 +72,7 @@ class SnarkBackend:
         public_inputs: str | Path | bytes | bytearray,
         proof: str | Path | bytes | bytearray,
     ) -> bool:
-        if statement_type not in _SCHEMAS:
-            raise ValueError(f"Unknown statement_type: {statement_type}")
-        schema_map = _SCHEMAS[statement_type]
-        if schema_version not in schema_map:
-            raise ValueError(
-                f"Unsupported schema_version {schema_version} for {statement_type}"
-            )
-
-        schema = schema_map[schema_version]
+        schema = _lookup_schema(statement_type, schema_version)
         public_inputs_bytes = _read_bytes(public_inputs)
         if public_inputs_bytes is None:
             return False
@@ -92,20 +84,84 @@ class SnarkBackend:
         if vk_bytes is None or proof_bytes is None:
             return False
 
-        module = _load_module(statement_type)
-        if module is None:
-            raise ValueError(f"Missing binding for statement_type: {statement_type}")
-        verifier = getattr(module, schema.verifier_bytes, None)
-        if verifier is None:
-            raise ValueError(
-                f"Missing verifier for {statement_type} schema v{schema_version}"
-            )
-
+        verifier = _load_verifier(statement_type, schema)
         try:
             return bool(verifier(vk_bytes, public_inputs_bytes, proof_bytes))
         except Exception:
             return False
 
+    @staticmethod
+    def verify_batch(
+        statement_type: str,
+        schema_version: int,
+        vk: str | Path | bytes | bytearray,
+        items: Iterable[
+            tuple[str | Path | bytes | bytearray, str | Path | bytes | bytearray]
+        ],
+    ) -> list[bool]:
+        """
+        Verify several (public_inputs, proof) pairs against one verifying key.
+
+        The schema, key and verifier binding are resolved once for the whole
+        batch. Returns one result per item, in order, with the same meaning
+        as verify().
+        """
+        schema = _lookup_schema(statement_type, schema_version)
+        items = list(items)
+        vk_bytes = _read_bytes(vk)
+        if vk_bytes is None:
+            return [False] * len(items)
+
+        prepared: list[tuple[bytes, bytes] | None] = []
+        for public_inputs, proof in items:
+            public_inputs_bytes = _read_bytes(public_inputs)
+            proof_bytes = _read_bytes(proof)
+            if (
+                public_inputs_bytes is None
+                or proof_bytes is None
+                or not _validate_header(schema, public_inputs_bytes)
+            ):
+                prepared.append(None)
+            else:
+                prepared.append((public_inputs_bytes, proof_bytes))
+        if not any(prepared):
+            return [False] * len(items)
+
+        verifier = _load_verifier(statement_type, schema)
+        results = []
+        for entry in prepared:
+            if entry is None:
+                results.append(False)
+                continue
+            try:
+                results.append(bool(verifier(vk_bytes, *entry)))
+            except Exception:
+                results.append(False)
+        return results
+
+
+def _lookup_schema(statement_type: str, schema_version: int) -> _SchemaInfo:
+    if statement_type not in _SCHEMAS:
+        raise ValueError(f"Unknown statement_type: {statement_type}")
+    schema_map = _SCHEMAS[statement_type]
+    if schema_version not in schema_map:
+        raise ValueError(
+            f"Unsupported schema_version {schema_version} for {statement_type}"
+        )
+    return schema_map[schema_version]
+
+
+def _load_verifier(statement_type: str, schema: _SchemaInfo):
+    module = _load_module(statement_type)
+    if module is None:
+        raise ValueError(f"Missing binding for statement_type: {statement_type}")
+    verifier = getattr(module, schema.verifier_bytes, None)
+    if verifier is None:
+        raise ValueError(
+            f"Missing verifier for {statement_type} schema v{schema.schema_version}"
+        )
+    return verifier
+
 
 def _read_bytes(value: str | Path | bytes | bytearray) -> bytes | None:
     if isinstance(value, (bytes, bytearray)):
@@ -144,6 +144,36 @@ def test_backend_rejects_tampered_public_inputs() -> None:
     )
 
 
+def test_backend_verify_batch_reports_each_item() -> None:
+    resolved = _resolve_fixture("membership", 1, depth=16)
+    if resolved is None:
+        pytest.skip("membership fixtures not available")
+    vk_path, public_inputs_path, proof_path = resolved
+    public_inputs_bytes = Path(public_inputs_path).read_bytes()
+    proof_bytes = Path(proof_path).read_bytes()
+    try:
+        results = SnarkBackend.verify_batch(
+            "membership",
+            1,
+            Path(vk_path).read_bytes(),
+            [
+                (public_inputs_bytes, proof_bytes),
+                (public_inputs_bytes, _tamper_bytes(proof_bytes)),
+                (public_inputs_path, proof_path),
+            ],
+        )
+    except ValueError as exc:
+        if "Missing binding" in str(exc):
+            pytest.skip("membership binding not available")
+        raise
+    assert results == [True, False, True]
+
+
+def test_backend_verify_batch_rejects_unknown_statement_type() -> None:
+    with pytest.raises(ValueError, match="Unknown statement_type"):
+        SnarkBackend.verify_batch("range", 1, "missing_vk.bin", [])
+
+
 def _resolve_fixture(
     statement: str,
     schema_version: int,
@@ -8,7 +8,7 @@ Generates comprehensive privacy reports in various formats:
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, TextIO
 
 from libp2p_privacy_poc.privacy_analyzer import PrivacyReport, PrivacyRisk
 from libp2p_privacy_poc.mock_zk_proofs import MockZKProof
@@ -22,15 +22,107 @@ from libp2p_privacy_poc.utils import (
 )
 
 
+# Static stylesheet for HTML reports, kept out of the per-report f-string
+_HTML_STYLE = """\
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #4CAF50;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #555;
+            margin-top: 30px;
+        }
+        .risk-score {
+            font-size: 48px;
+            font-weight: bold;
+            text-align: center;
+            padding: 20px;
+            border-radius: 8px;
+            margin: 20px 0;
+        }
+        .risk-low { background-color: #4CAF50; color: white; }
+        .risk-medium { background-color: #FF9800; color: white; }
+        .risk-high { background-color: #F44336; color: white; }
+        .risk-critical { background-color: #D32F2F; color: white; }
+        .risk-item {
+            margin: 15px 0;
+            padding: 15px;
+            border-left: 4px solid #ccc;
+            background-color: #f9f9f9;
+        }
+        .risk-item.critical { border-left-color: #D32F2F; }
+        .risk-item.high { border-left-color: #F44336; }
+        .risk-item.medium { border-left-color: #FF9800; }
+        .risk-item.low { border-left-color: #4CAF50; }
+        .badge {
+            display: inline-block;
+            padding: 3px 8px;
+            border-radius: 3px;
+            font-size: 12px;
+            font-weight: bold;
+            color: white;
+        }
+        .badge-critical { background-color: #D32F2F; }
+        .badge-high { background-color: #F44336; }
+        .badge-medium { background-color: #FF9800; }
+        .badge-low { background-color: #4CAF50; }
+        .warning {
+            background-color: #FFF3CD;
+            border: 1px solid #FFC107;
+            padding: 15px;
+            border-radius: 4px;
+            margin: 20px 0;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin: 20px 0;
+        }
+        .stat-card {
+            padding: 15px;
+            background-color: #f0f0f0;
+            border-radius: 4px;
+            text-align: center;
+        }
+        .stat-value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #333;
+        }
+        .stat-label {
+            font-size: 14px;
+            color: #666;
+            margin-top: 5px;
+        }
+    </style>
+"""
+
+
 class ReportGenerator:
     """
     Generates privacy analysis reports in multiple formats.
     """
-    
+
     def __init__(self):
         """Initialize the report generator."""
         self.report_id = generate_report_id()
-    
+
     def generate_console_report(
         self,
         report: PrivacyReport,
@@ -55,26 +147,75 @@ class ReportGenerator:
         Returns:
             Formatted console report string
         """
-        lines = []
+        return "\n".join(self._iter_console_lines(
+            report,
+            zk_proofs,
+            verbose=verbose,
+            real_zk_proof=real_zk_proof,
+            real_phase2b_proofs=real_phase2b_proofs,
+            snark_phase2b_proofs=snark_phase2b_proofs,
+            data_source=data_source,
+            proof_exchange_summary=proof_exchange_summary,
+            warnings=warnings,
+            reproducibility=reproducibility,
+        ))
+
+    def stream_console_report(
+        self,
+        fp: TextIO,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Write a console report straight to a file object, line by line.
+        
+        Produces the same text as generate_console_report().
         
+        Args:
+            fp: Writable text file object
+            report: The privacy report
+            zk_proofs: Optional ZK proofs to include
+            **options: Any other generate_console_report() keyword argument
+        """
+        lines = self._iter_console_lines(report, zk_proofs, **options)
+        fp.write(next(lines))
+        for line in lines:
+            fp.write("\n")
+            fp.write(line)
+
+    def _iter_console_lines(
+        self,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        verbose: bool = False,
+        real_zk_proof: Optional[Dict[str, Any]] = None,
+        real_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        snark_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        data_source: Optional[str] = None,
+        proof_exchange_summary: Optional[Dict[str, Any]] = None,
+        warnings: Optional[List[Dict[str, Any]]] = None,
+        reproducibility: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Yield the console report one line at a time."""
         # Header
-        lines.append("")
-        lines.append("=" * 80)
-        lines.append(color_text("PRIVACY ANALYSIS REPORT", "cyan"))
-        lines.append("=" * 80)
-        lines.append(f"Report ID: {self.report_id}")
-        lines.append(f"Timestamp: {format_timestamp(report.timestamp)}")
+        yield ""
+        yield "=" * 80
+        yield color_text("PRIVACY ANALYSIS REPORT", "cyan")
+        yield "=" * 80
+        yield f"Report ID: {self.report_id}"
+        yield f"Timestamp: {format_timestamp(report.timestamp)}"
         if data_source:
-            lines.append(f"Data Source: {data_source}")
-        lines.append("")
+            yield f"Data Source: {data_source}"
+        yield ""
 
         if proof_exchange_summary:
-            lines.append("-" * 80)
-            lines.append(color_text("PROOF EXCHANGE SUMMARY", "cyan"))
-            lines.append("-" * 80)
-            lines.append(f"Protocol ID: {proof_exchange_summary.get('protocol_id', 'unknown')}")
+            yield "-" * 80
+            yield color_text("PROOF EXCHANGE SUMMARY", "cyan")
+            yield "-" * 80
+            yield f"Protocol ID: {proof_exchange_summary.get('protocol_id', 'unknown')}"
             peer_addr = proof_exchange_summary.get("peer_multiaddr") or "unknown"
-            lines.append(f"Peer Multiaddr: {peer_addr}")
+            yield f"Peer Multiaddr: {peer_addr}"
             statements = proof_exchange_summary.get("statements", [])
             for item in statements:
                 statement = item.get("statement", "unknown")
@@ -88,187 +229,185 @@ class ReportGenerator:
                 asset_hash = asset.get("sha256", "")
                 asset_label = f"{asset_hash[:12]}…" if asset_hash else "unknown"
                 status = color_text("✓", "green") if verified else color_text("✗", "red")
-                lines.append(
+                yield (
                     f"  - {statement}: {status} (schema v{schema_v}, depth {depth})"
                 )
-                lines.append(f"    Mode: {mode}")
+                yield f"    Mode: {mode}"
                 if verify_ms is not None:
-                    lines.append(f"    Verify Time: {verify_ms} ms")
+                    yield f"    Verify Time: {verify_ms} ms"
                 if exchange_ms is not None:
-                    lines.append(f"    Exchange Time: {exchange_ms} ms")
-                lines.append(f"    Asset Hash: {asset_label}")
-            lines.append("")
+                    yield f"    Exchange Time: {exchange_ms} ms"
+                yield f"    Asset Hash: {asset_label}"
+            yield ""
         
         # Overall risk score
         risk_color = self._get_risk_color(report.overall_risk_score)
-        lines.append(color_text(f"Overall Risk Score: {report.overall_risk_score:.2f}/1.00", risk_color))
-        lines.append(color_text(f"Risk Level: {report.get_risk_level()}", risk_color))
-        lines.append("")
+        yield color_text(f"Overall Risk Score: {report.overall_risk_score:.2f}/1.00", risk_color)
+        yield color_text(f"Risk Level: {report.get_risk_level()}", risk_color)
+        yield ""
         
         # Statistics
-        lines.append("-" * 80)
-        lines.append(color_text("NETWORK STATISTICS", "cyan"))
-        lines.append("-" * 80)
+        yield "-" * 80
+        yield color_text("NETWORK STATISTICS", "cyan")
+        yield "-" * 80
         for key, value in report.statistics.items():
-            lines.append(f"  {key.replace('_', ' ').title()}: {value}")
-        lines.append("")
+            yield f"  {key.replace('_', ' ').title()}: {value}"
+        yield ""
 
         if warnings:
-            lines.append("-" * 80)
-            lines.append(color_text("WARNINGS", "cyan"))
-            lines.append("-" * 80)
+            yield "-" * 80
+            yield color_text("WARNINGS", "cyan")
+            yield "-" * 80
             for warning in warnings:
                 message = warning.get("message", "unknown warning")
                 impact = warning.get("impact")
-                lines.append(f"  - {message}")
+                yield f"  - {message}"
                 if impact:
-                    lines.append(f"    Impact: {impact}")
-            lines.append("")
+                    yield f"    Impact: {impact}"
+            yield ""
         
         # Risks summary
-        lines.append("-" * 80)
-        lines.append(color_text("PRIVACY RISKS DETECTED", "cyan"))
-        lines.append("-" * 80)
-        lines.append(f"Total Risks: {len(report.risks)}")
-        lines.append(f"  {format_risk_severity('critical')}: {len(report.get_critical_risks())}")
-        lines.append(f"  {format_risk_severity('high')}: {len(report.get_high_risks())}")
-        lines.append(f"  {format_risk_severity('medium')}: {len(report.get_risks_by_severity('medium'))}")
-        lines.append(f"  {format_risk_severity('low')}: {len(report.get_risks_by_severity('low'))}")
-        lines.append("")
+        yield "-" * 80
+        yield color_text("PRIVACY RISKS DETECTED", "cyan")
+        yield "-" * 80
+        yield f"Total Risks: {len(report.risks)}"
+        yield f"  {format_risk_severity('critical')}: {len(report.get_critical_risks())}"
+        yield f"  {format_risk_severity('high')}: {len(report.get_high_risks())}"
+        yield f"  {format_risk_severity('medium')}: {len(report.get_risks_by_severity('medium'))}"
+        yield f"  {format_risk_severity('low')}: {len(report.get_risks_by_severity('low'))}"
+        yield ""
         
         # Detailed risks
         if report.risks:
-            lines.append("-" * 80)
-            lines.append(color_text("DETAILED RISK ANALYSIS", "cyan"))
-            lines.append("-" * 80)
+            yield "-" * 80
+            yield color_text("DETAILED RISK ANALYSIS", "cyan")
+            yield "-" * 80
             
             for i, risk in enumerate(report.risks, 1):
-                lines.append(f"\n{i}. {format_risk_severity(risk.severity)} - {risk.risk_type}")
-                lines.append(f"   {risk.description}")
-                lines.append(f"   Confidence: {risk.confidence:.0%}")
+                yield f"\n{i}. {format_risk_severity(risk.severity)} - {risk.risk_type}"
+                yield f"   {risk.description}"
+                yield f"   Confidence: {risk.confidence:.0%}"
                 
                 if verbose and risk.affected_peers:
-                    lines.append(f"   Affected Peers: {len(risk.affected_peers)}")
+                    yield f"   Affected Peers: {len(risk.affected_peers)}"
                     for peer in risk.affected_peers[:3]:
-                        lines.append(f"     - {truncate_peer_id(peer)}")
+                        yield f"     - {truncate_peer_id(peer)}"
                 
                 if verbose and risk.recommendations:
-                    lines.append("   Recommendations:")
+                    yield "   Recommendations:"
                     for rec in risk.recommendations[:2]:
-                        lines.append(f"     • {rec}")
+                        yield f"     • {rec}"
         
         # ZK Proofs section
         if zk_proofs:
-            lines.append("")
-            lines.append("-" * 80)
-            lines.append(color_text("ZERO-KNOWLEDGE PROOFS", "cyan"))
-            lines.append(color_text("⚠️  MOCK PROOFS - FOR DEMONSTRATION ONLY", "yellow"))
-            lines.append("-" * 80)
+            yield ""
+            yield "-" * 80
+            yield color_text("ZERO-KNOWLEDGE PROOFS", "cyan")
+            yield color_text("⚠️  MOCK PROOFS - FOR DEMONSTRATION ONLY", "yellow")
+            yield "-" * 80
             
             total_proofs = sum(len(proofs) for proofs in zk_proofs.values())
-            lines.append(f"Total ZK Proofs Generated: {total_proofs}")
+            yield f"Total ZK Proofs Generated: {total_proofs}"
             
             for proof_type, proofs in zk_proofs.items():
                 if proofs:
-                    lines.append(f"\n{proof_type.replace('_', ' ').title()}: {len(proofs)}")
+                    yield f"\n{proof_type.replace('_', ' ').title()}: {len(proofs)}"
                     if verbose:
                         for proof in proofs[:3]:
-                            lines.append(f"  • {proof.claim}")
-                            lines.append(f"    Verified: {color_text('✓', 'green') if proof.verify() else color_text('✗', 'red')}")
+                            yield f"  • {proof.claim}"
+                            yield f"    Verified: {color_text('✓', 'green') if proof.verify() else color_text('✗', 'red')}"
         
         if real_zk_proof is not None or real_phase2b_proofs or snark_phase2b_proofs:
-            lines.append("")
-            lines.append("-" * 80)
-            lines.append(color_text("PROOF VERIFICATION", "cyan"))
-            lines.append("-" * 80)
+            yield ""
+            yield "-" * 80
+            yield color_text("PROOF VERIFICATION", "cyan")
+            yield "-" * 80
             if real_zk_proof is not None:
-                lines.append(f"Backend: {real_zk_proof.get('backend', 'unknown')}")
-                lines.append(f"Statement: {real_zk_proof.get('statement', 'unknown')}")
+                yield f"Backend: {real_zk_proof.get('backend', 'unknown')}"
+                yield f"Statement: {real_zk_proof.get('statement', 'unknown')}"
                 peer_id = real_zk_proof.get("peer_id")
                 session_id = real_zk_proof.get("session_id")
                 if peer_id:
-                    lines.append(f"Peer ID: {truncate_peer_id(peer_id)}")
+                    yield f"Peer ID: {truncate_peer_id(peer_id)}"
                 if session_id:
-                    lines.append(f"Session ID: {session_id}")
+                    yield f"Session ID: {session_id}"
                 if real_zk_proof.get("verified"):
-                    lines.append(f"Verified: {color_text('✓', 'green')}")
+                    yield f"Verified: {color_text('✓', 'green')}"
                 else:
-                    lines.append(f"Verified: {color_text('✗', 'red')}")
+                    yield f"Verified: {color_text('✗', 'red')}"
                     error = real_zk_proof.get("error")
                     if error:
-                        lines.append(f"Error: {error}")
+                        yield f"Error: {error}"
 
             if real_phase2b_proofs:
                 if real_zk_proof is not None:
-                    lines.append("")
-                lines.append("Proof Statements:")
+                    yield ""
+                yield "Proof Statements:"
                 for proof in real_phase2b_proofs:
                     statement = proof.get("statement", "unknown")
                     verified = proof.get("verified")
                     status = color_text("✓", "green") if verified else color_text("✗", "red")
-                    lines.append(f"  - {statement}: {status}")
+                    yield f"  - {statement}: {status}"
                     mode = proof.get("prove_mode")
                     if mode:
-                        lines.append(f"    Mode: {mode}")
+                        yield f"    Mode: {mode}"
                     error = proof.get("error")
                     if not verified and error:
-                        lines.append(f"    Error: {error}")
+                        yield f"    Error: {error}"
 
             if snark_phase2b_proofs:
                 if real_zk_proof is not None or real_phase2b_proofs:
-                    lines.append("")
-                lines.append("SNARK Proof Statements:")
+                    yield ""
+                yield "SNARK Proof Statements:"
                 for proof in snark_phase2b_proofs:
                     statement = proof.get("statement", "unknown")
                     verified = proof.get("verified")
                     status = color_text("✓", "green") if verified else color_text("✗", "red")
-                    lines.append(f"  - {statement}: {status}")
+                    yield f"  - {statement}: {status}"
                     mode = proof.get("prove_mode")
                     if mode:
-                        lines.append(f"    Mode: {mode}")
+                        yield f"    Mode: {mode}"
                     error = proof.get("error")
                     if not verified and error:
-                        lines.append(f"    Error: {error}")
+                        yield f"    Error: {error}"
 
         # Recommendations
         if report.recommendations:
-            lines.append("")
-            lines.append("-" * 80)
-            lines.append(color_text("RECOMMENDATIONS", "cyan"))
-            lines.append("-" * 80)
+            yield ""
+            yield "-" * 80
+            yield color_text("RECOMMENDATIONS", "cyan")
+            yield "-" * 80
             for i, rec in enumerate(report.recommendations[:10], 1):
-                lines.append(f"{i}. {rec}")
+                yield f"{i}. {rec}"
         
         # Timing analysis
         if verbose and report.timing_analysis:
-            lines.append("")
-            lines.append("-" * 80)
-            lines.append(color_text("TIMING ANALYSIS", "cyan"))
-            lines.append("-" * 80)
+            yield ""
+            yield "-" * 80
+            yield color_text("TIMING ANALYSIS", "cyan")
+            yield "-" * 80
             for key, value in report.timing_analysis.items():
                 if isinstance(value, float):
-                    lines.append(f"  {key.replace('_', ' ').title()}: {format_duration(value)}")
+                    yield f"  {key.replace('_', ' ').title()}: {format_duration(value)}"
                 else:
-                    lines.append(f"  {key.replace('_', ' ').title()}: {value}")
+                    yield f"  {key.replace('_', ' ').title()}: {value}"
         
         # Footer
-        lines.append("")
+        yield ""
         if reproducibility:
-            lines.append("-" * 80)
-            lines.append(color_text("REPRODUCIBILITY", "cyan"))
-            lines.append("-" * 80)
-            lines.append(f"Command: {reproducibility.get('command', 'unknown')}")
-            lines.append(f"Git Commit: {reproducibility.get('git_commit', 'unknown')}")
-            lines.append(f"Python: {reproducibility.get('python_version', 'unknown')}")
-            lines.append(f"OS: {reproducibility.get('os', 'unknown')}")
-            lines.append(f"Assets Dir: {reproducibility.get('assets_dir', 'unknown')}")
-            lines.append("")
-        lines.append("=" * 80)
-        lines.append(color_text("END OF REPORT", "cyan"))
-        lines.append("=" * 80)
-        lines.append("")
-        
-        return "\n".join(lines)
+            yield "-" * 80
+            yield color_text("REPRODUCIBILITY", "cyan")
+            yield "-" * 80
+            yield f"Command: {reproducibility.get('command', 'unknown')}"
+            yield f"Git Commit: {reproducibility.get('git_commit', 'unknown')}"
+            yield f"Python: {reproducibility.get('python_version', 'unknown')}"
+            yield f"OS: {reproducibility.get('os', 'unknown')}"
+            yield f"Assets Dir: {reproducibility.get('assets_dir', 'unknown')}"
+            yield ""
+        yield "=" * 80
+        yield color_text("END OF REPORT", "cyan")
+        yield "=" * 80
+        yield ""
     
     def generate_json_report(
         self,
@@ -294,6 +433,56 @@ class ReportGenerator:
         Returns:
             JSON string
         """
+        data = self._build_json_data(
+            report,
+            zk_proofs,
+            certificate=certificate,
+            real_zk_proof=real_zk_proof,
+            real_phase2b_proofs=real_phase2b_proofs,
+            snark_phase2b_proofs=snark_phase2b_proofs,
+            data_source=data_source,
+            proof_exchange_summary=proof_exchange_summary,
+            warnings=warnings,
+            reproducibility=reproducibility,
+        )
+        return json.dumps(data, indent=2)
+
+    def stream_json_report(
+        self,
+        fp: TextIO,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Write a JSON report straight to a file object.
+        
+        Produces the same document as generate_json_report(), encoded
+        incrementally instead of as one string.
+        
+        Args:
+            fp: Writable text file object
+            report: The privacy report
+            zk_proofs: Optional ZK proofs to include
+            **options: Any other generate_json_report() keyword argument
+        """
+        data = self._build_json_data(report, zk_proofs, **options)
+        json.dump(data, fp, indent=2)
+
+    def _build_json_data(
+        self,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        certificate: Optional[dict] = None,
+        real_zk_proof: Optional[Dict[str, Any]] = None,
+        real_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        snark_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        data_source: Optional[str] = None,
+        proof_exchange_summary: Optional[Dict[str, Any]] = None,
+        warnings: Optional[List[Dict[str, Any]]] = None,
+        reproducibility: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Assemble the JSON report document."""
         data = {
             "report_id": self.report_id,
             "timestamp": report.timestamp,
@@ -333,7 +522,7 @@ class ReportGenerator:
             "WARNING": "PROOF OF CONCEPT - NOT PRODUCTION READY",
         }
         
-        return json.dumps(data, indent=2)
+        return data
     
     def generate_html_report(
         self,
@@ -357,99 +546,58 @@ class ReportGenerator:
         Returns:
             HTML string
         """
-        html = f"""
+        return "".join(self._iter_html_chunks(
+            report,
+            zk_proofs,
+            real_zk_proof=real_zk_proof,
+            real_phase2b_proofs=real_phase2b_proofs,
+            snark_phase2b_proofs=snark_phase2b_proofs,
+            data_source=data_source,
+            proof_exchange_summary=proof_exchange_summary,
+            warnings=warnings,
+            reproducibility=reproducibility,
+        ))
+
+    def stream_html_report(
+        self,
+        fp: TextIO,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Write an HTML report straight to a file object, section by section.
+        
+        Produces the same document as generate_html_report().
+        
+        Args:
+            fp: Writable text file object
+            report: The privacy report
+            zk_proofs: Optional ZK proofs to include
+            **options: Any other generate_html_report() keyword argument
+        """
+        for chunk in self._iter_html_chunks(report, zk_proofs, **options):
+            fp.write(chunk)
+
+    def _iter_html_chunks(
+        self,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        real_zk_proof: Optional[Dict[str, Any]] = None,
+        real_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        snark_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        data_source: Optional[str] = None,
+        proof_exchange_summary: Optional[Dict[str, Any]] = None,
+        warnings: Optional[List[Dict[str, Any]]] = None,
+        reproducibility: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Yield the HTML report in document order, one section at a time."""
+        yield f"""
 <!DOCTYPE html>
 <html>
 <head>
     <title>Privacy Analysis Report - {self.report_id}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #333;
-            border-bottom: 3px solid #4CAF50;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #555;
-            margin-top: 30px;
-        }}
-        .risk-score {{
-            font-size: 48px;
-            font-weight: bold;
-            text-align: center;
-            padding: 20px;
-            border-radius: 8px;
-            margin: 20px 0;
-        }}
-        .risk-low {{ background-color: #4CAF50; color: white; }}
-        .risk-medium {{ background-color: #FF9800; color: white; }}
-        .risk-high {{ background-color: #F44336; color: white; }}
-        .risk-critical {{ background-color: #D32F2F; color: white; }}
-        .risk-item {{
-            margin: 15px 0;
-            padding: 15px;
-            border-left: 4px solid #ccc;
-            background-color: #f9f9f9;
-        }}
-        .risk-item.critical {{ border-left-color: #D32F2F; }}
-        .risk-item.high {{ border-left-color: #F44336; }}
-        .risk-item.medium {{ border-left-color: #FF9800; }}
-        .risk-item.low {{ border-left-color: #4CAF50; }}
-        .badge {{
-            display: inline-block;
-            padding: 3px 8px;
-            border-radius: 3px;
-            font-size: 12px;
-            font-weight: bold;
-            color: white;
-        }}
-        .badge-critical {{ background-color: #D32F2F; }}
-        .badge-high {{ background-color: #F44336; }}
-        .badge-medium {{ background-color: #FF9800; }}
-        .badge-low {{ background-color: #4CAF50; }}
-        .warning {{
-            background-color: #FFF3CD;
-            border: 1px solid #FFC107;
-            padding: 15px;
-            border-radius: 4px;
-            margin: 20px 0;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        .stat-card {{
-            padding: 15px;
-            background-color: #f0f0f0;
-            border-radius: 4px;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #333;
-        }}
-        .stat-label {{
-            font-size: 14px;
-            color: #666;
-            margin-top: 5px;
-        }}
-    </style>
-</head>
+{_HTML_STYLE}</head>
 <body>
     <div class="container">
         <h1>Privacy Analysis Report</h1>
@@ -478,11 +626,20 @@ class ReportGenerator:
         {self._generate_warnings_html(warnings)}
         
         <h2>Privacy Risks ({len(report.risks)})</h2>
-        {self._generate_risk_items_html(report.risks)}
+        """
+        yield self._generate_risk_items_html(report.risks)
+        yield """
         
-        {self._generate_zk_proofs_html(zk_proofs) if zk_proofs else ''}
+        """
+        if zk_proofs:
+            yield self._generate_zk_proofs_html(zk_proofs)
+        yield """
         
-        {self._generate_real_zk_proof_html(real_zk_proof, real_phase2b_proofs, snark_phase2b_proofs)}
+        """
+        yield self._generate_real_zk_proof_html(
+            real_zk_proof, real_phase2b_proofs, snark_phase2b_proofs
+        )
+        yield f"""
 
         {self._generate_reproducibility_html(reproducibility)}
         
@@ -494,7 +651,6 @@ class ReportGenerator:
 </body>
 </html>
 """
-        return html
     
     def _get_risk_color(self, score: float) -> str:
         """Get color for risk score."""
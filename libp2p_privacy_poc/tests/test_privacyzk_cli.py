@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from click.testing import CliRunner
 
 from libp2p_privacy_poc import cli
+from libp2p_privacy_poc.network.privacyzk.constants import (
+    DEFAULT_MEMBERSHIP_DEPTH,
+    SNARK_SCHEMA_V,
+)
 
 
 def test_zk_serve_help() -> None:
@@ -34,3 +40,33 @@ def test_zk_verify_rejects_bad_depth() -> None:
         ],
     )
     assert result.exit_code != 0
+
+
+def test_json_result_line_keeps_json_dumps_format(capsys) -> None:
+    cli._emit_result(True, True, False, "membership", 2, 16, 'proof "rejected"')
+    cli._emit_result(True, False, False, "café ✗", None, None, None)
+
+    assert capsys.readouterr().out.splitlines() == [
+        '{"ok": true, "verified": false, "statement": "membership", '
+        '"schema": 2, "depth": 16, "error": "proof \\"rejected\\""}',
+        '{"ok": false, "verified": false, "statement": "caf\\u00e9 \\u2717", '
+        '"schema": null, "depth": null, "error": null}',
+    ]
+
+
+def test_load_verifier_key_reads_vk_from_fixture_tree(
+    tmp_path: Path, monkeypatch
+) -> None:
+    base = tmp_path / "membership" / "v2" / f"depth-{DEFAULT_MEMBERSHIP_DEPTH}"
+    base.mkdir(parents=True)
+    (base / "membership_vk.bin").write_bytes(b"vk-bytes")
+    (base / "public_inputs.bin").write_bytes(b"pi")
+    (base / "membership_proof.bin").write_bytes(b"proof")
+
+    args = ("membership", SNARK_SCHEMA_V, DEFAULT_MEMBERSHIP_DEPTH)
+    vk = cli._load_verifier_key(str(tmp_path), *args)
+
+    assert vk == b"vk-bytes"
+    monkeypatch.chdir(tmp_path)
+    (base / "membership_vk.bin").unlink()
+    assert cli._load_verifier_key(".", *args) == b"vk-bytes"
@@ -32,8 +32,7 @@ def get_peer_listening_address(host) -> Multiaddr:
     if not network.listeners:
         raise ValueError(f"Host {host.get_id()} has no active listeners")
     
-    listener_key = list(network.listeners.keys())[0]
-    listener = network.listeners[listener_key]
+    listener = next(iter(network.listeners.values()))
     actual_addr = listener.get_addrs()[0]
     return actual_addr.encapsulate(Multiaddr(f"/p2p/{host.get_id()}"))
 
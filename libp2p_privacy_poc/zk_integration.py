@@ -478,10 +478,13 @@ def _select_session_id(collector, peer_id: str) -> str:
     return session_id
 
 
-def generate_real_commitment_proof(collector) -> Dict[str, Any]:
+def generate_real_commitment_proof(collector, backend=None) -> Dict[str, Any]:
     """
     Generate and verify a real Pedersen+Schnorr commitment-opening proof.
 
+    Pass ``backend`` to reuse an existing Pedersen backend (and its curve
+    parameters); a new one is created when omitted.
+
     Returns a dict with proof metadata and verification result. On failure,
     returns verified=False and an error message without raising.
     """
@@ -564,7 +567,8 @@ def generate_real_commitment_proof(collector) -> Dict[str, Any]:
             session_id=session_id,
             metadata={"source": "real_zk_integration"},
         )
-        backend = get_zk_backend(prefer="pedersen")
+        if backend is None:
+            backend = get_zk_backend(prefer="pedersen")
         if not hasattr(backend, "generate_commitment_opening_proof"):
             raise AttributeError(
                 "backend does not support commitment opening proofs"
@@ -581,10 +585,13 @@ def generate_real_commitment_proof(collector) -> Dict[str, Any]:
         return result
 
 
-def generate_real_phase2b_proofs(collector) -> List[Dict[str, Any]]:
+def generate_real_phase2b_proofs(collector, backend=None) -> List[Dict[str, Any]]:
     """
     Generate and verify Phase 2B proofs (membership, unlinkability, continuity).
 
+    Pass ``backend`` to reuse an existing Pedersen backend; a new one is
+    created when omitted.
+
     Returns a list of proof result dicts. On failure, each result includes
     verified=False and an error message without raising.
     """
@@ -628,7 +635,8 @@ def generate_real_phase2b_proofs(collector) -> List[Dict[str, Any]]:
         from libp2p_privacy_poc.privacy_protocol.statements import StatementType
         from libp2p_privacy_poc.privacy_protocol.types import ProofContext
 
-        backend = get_zk_backend(prefer="pedersen")
+        if backend is None:
+            backend = get_zk_backend(prefer="pedersen")
         required_methods = (
             "generate_membership_proof",
             "verify_membership_proof",
@@ -40,6 +40,9 @@ setup(
         "pyyaml>=6.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+        ],
         "dev": [
             "pytest>=8.0.0",
             "pytest-trio>=0.8.0",
@@ -20,7 +20,7 @@ def get_cli_command():
     return [sys.executable, "-m", "libp2p_privacy_poc.cli"]
 
 
-def run_cli(*args, timeout=30, check=True):
+def run_cli(*args, timeout=30, check=True, input=None):
     """
     Helper function to run CLI commands.
     
@@ -28,6 +28,7 @@ def run_cli(*args, timeout=30, check=True):
         *args: CLI arguments
         timeout: Command timeout in seconds
         check: Whether to check return code
+        input: Optional text fed to the command's stdin
         
     Returns:
         subprocess.CompletedProcess
@@ -38,7 +39,8 @@ def run_cli(*args, timeout=30, check=True):
         capture_output=True,
         text=True,
         timeout=timeout,
-        check=check
+        check=check,
+        input=input,
     )
 
 
@@ -268,6 +270,30 @@ def test_cli_invalid_format():
     print("✓ Invalid format properly rejected")
 
 
+def test_cli_zk_verify_batch_rejects_bad_lines():
+    """Test zk-verify-batch reports malformed request lines in order."""
+    print("\n" + "=" * 70)
+    print("TEST: CLI zk-verify-batch (Malformed Lines)")
+    print("=" * 70)
+    
+    result = run_cli(
+        "zk-verify-batch",
+        "--peer", "/ip4/127.0.0.1/tcp/1",
+        "--json",
+        check=False,
+        input="# comment\n\nbogus\ncontinuity 2 4\n",
+    )
+    
+    assert result.returncode == 1, "Malformed lines should fail the batch"
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["statement"] for r in results] == ["bogus", "continuity"]
+    assert all(not r["ok"] and not r["verified"] for r in results)
+    assert results[0]["error"].startswith("line 3:")
+    assert "Depth must be 0" in results[1]["error"]
+    
+    print("✓ Malformed batch lines reported")
+
+
 def test_cli_analyze_real_network_no_connections():
     """Test that analyze works even with no connections."""
     print("\n" + "=" * 70)
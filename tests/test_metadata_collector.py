@@ -0,0 +1,246 @@
+"""
+Unit tests for MetadataCollector bookkeeping.
+
+These drive the collector's event handlers directly, without a libp2p host.
+"""
+import io
+import json
+
+import pytest
+import trio
+from multiaddr import Multiaddr
+
+from libp2p_privacy_poc import metadata_collector
+from libp2p_privacy_poc.metadata_collector import (
+    DEFAULT_MAX_HISTORY,
+    MetadataCollector,
+    _conn_multiaddr,
+)
+from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
+
+
+PEER_A = "QmPeerA" + "a" * 39
+PEER_B = "QmPeerB" + "b" * 39
+
+
+def test_connection_event_set_on_first_connection():
+    collector = MetadataCollector(libp2p_host=None)
+    assert not collector.connection_event.is_set()
+
+    collector.on_connection_opened(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound")
+
+    assert collector.connection_event.is_set()
+
+    collector.clear()
+    assert not collector.connection_event.is_set()
+
+
+def test_statistics_track_open_and_close():
+    collector = MetadataCollector(libp2p_host=None)
+    collector.on_connection_opened(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound")
+    collector.on_connection_opened(PEER_B, Multiaddr("/ip4/127.0.0.1/tcp/4002"), "inbound")
+    collector.on_protocol_negotiated(PEER_A, "/ipfs/id/1.0.0")
+
+    stats = collector.get_statistics()
+    assert stats["total_connections"] == 2
+    assert stats["active_connections"] == 2
+    assert stats["unique_peers"] == 2
+    assert stats["protocols_used"] == 1
+
+    collector.on_connection_closed(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"))
+
+    stats = collector.get_statistics()
+    assert stats["active_connections"] == len(collector.get_active_connections()) == 1
+    assert stats["total_disconnections"] == 1
+    assert stats["total_connection_history"] == 1
+
+
+def test_connection_opened_accepts_explicit_timestamp():
+    collector = MetadataCollector(libp2p_host=None)
+    for i in range(3):
+        collector.on_connection_opened(
+            PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound", timestamp=100.0 + i
+        )
+
+    assert list(collector.connection_times) == [100.0, 101.0, 102.0]
+    assert len(collector.connections) == 3
+    assert sorted(c.timestamp_start for c in collector.connections.values()) == [100.0, 101.0, 102.0]
+    peer = collector.peers[PEER_A]
+    assert (peer.first_seen, peer.last_seen) == (100.0, 102.0)
+
+
+def test_peer_events_only_touch_open_connections():
+    collector = MetadataCollector(libp2p_host=None)
+    addr = Multiaddr("/ip4/127.0.0.1/tcp/4001")
+    for i in range(3):
+        collector.on_connection_opened(PEER_A, addr, "outbound", timestamp=100.0 + i)
+    collector.on_connection_opened(PEER_B, addr, "inbound", timestamp=200.0)
+
+    # Closes A's oldest open connection first
+    collector.on_connection_closed(PEER_A, addr)
+    assert [c.timestamp_start for c in collector.connection_history] == [100.0]
+
+    collector.on_stream_opened(PEER_A)
+    collector.on_protocol_negotiated(PEER_A, "/ipfs/id/1.0.0")
+    collector.record_data_transfer(PEER_A, 10, 20)
+
+    by_start = {c.timestamp_start: c for c in collector.connections.values()}
+    assert by_start[100.0].stream_count == 0
+    assert by_start[100.0].protocols == []
+    for start in (101.0, 102.0):
+        assert by_start[start].stream_count == 1
+        assert by_start[start].protocols == ["/ipfs/id/1.0.0"]
+        assert (by_start[start].bytes_sent, by_start[start].bytes_received) == (10, 20)
+    assert by_start[200.0].stream_count == 0
+
+    for _ in range(3):
+        collector.on_connection_closed(PEER_A, addr)
+    assert collector.get_statistics()["total_disconnections"] == 3
+
+
+def test_max_history_drops_oldest_closed_connections():
+    collector = MetadataCollector(libp2p_host=None, max_history=2)
+    addr = Multiaddr("/ip4/127.0.0.1/tcp/4001")
+    for i in range(4):
+        collector.on_connection_opened(PEER_A, addr, "outbound", timestamp=100.0 + i)
+    collector.on_connection_closed(PEER_A, addr)
+    collector.on_connection_closed(PEER_A, addr)
+    collector.on_connection_closed(PEER_A, addr)
+
+    assert [c.timestamp_start for c in collector.connection_history] == [101.0, 102.0]
+    assert sorted(c.timestamp_start for c in collector.connections.values()) == [
+        101.0, 102.0, 103.0,
+    ]
+    assert collector.get_statistics()["total_disconnections"] == 3
+
+
+def test_history_is_bounded_by_default():
+    assert MetadataCollector().connection_history.maxlen == DEFAULT_MAX_HISTORY
+    assert MetadataCollector(max_history=None).connection_history.maxlen is None
+
+
+def test_export_data_timings_serialize_and_clear():
+    collector = MetadataCollector(libp2p_host=None)
+    collector.on_connection_opened(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound")
+    collector.on_connection_closed(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"))
+
+    exported = json.loads(json.dumps(collector.export_data()))
+    assert exported["connection_times"] == [collector.connection_times[0]]
+    assert len(exported["disconnection_times"]) == 1
+
+    collector.clear()
+    assert len(collector.connection_times) == len(collector.disconnection_times) == 0
+
+
+def test_analyzer_reuses_report_until_collector_changes():
+    collector = MetadataCollector(libp2p_host=None)
+    collector.on_connection_opened(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound")
+    analyzer = PrivacyAnalyzer(collector)
+
+    first = analyzer.analyze()
+    first.risks.clear()
+    first.recommendations.append("caller note")
+    again = analyzer.analyze()
+    assert again is not first
+    assert again.risks
+    assert "caller note" not in again.recommendations
+    assert again.timestamp >= first.timestamp
+    assert analyzer.analyze(stats={"total_connections": 99}).statistics == {
+        "total_connections": 99
+    }
+
+    collector.on_connection_opened(PEER_B, Multiaddr("/ip4/127.0.0.1/tcp/4002"), "inbound")
+    second = analyzer.analyze()
+    assert second.statistics["total_connections"] == 2
+
+    analyzer.MIN_ANONYMITY_SET_SIZE = 2
+    assert len(analyzer.analyze().risks) != len(second.risks)
+
+
+def test_wait_for_connections_wakes_on_capture():
+    collector = MetadataCollector(libp2p_host=None)
+    results = []
+
+    async def waiter():
+        results.append(await collector.wait_for_connections(2, timeout=5))
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(waiter)
+            await trio.sleep(0)
+            collector.on_connection_opened(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound")
+            await trio.sleep(0)
+            collector.on_connection_opened(PEER_B, Multiaddr("/ip4/127.0.0.1/tcp/4002"), "outbound")
+
+    trio.run(main)
+    assert results == [True]
+
+
+def test_clear_wakes_tasks_waiting_on_connection_event():
+    collector = MetadataCollector(libp2p_host=None)
+    woken = []
+
+    async def scenario():
+        async def waiter(event):
+            await event.wait()
+            woken.append(True)
+
+        with trio.fail_after(1):
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(waiter, collector.connection_event)
+                await trio.sleep(0)
+                collector.clear()
+
+    trio.run(scenario)
+
+    assert woken == [True]
+    assert not collector.connection_event.is_set()
+
+
+def test_wait_for_connections_times_out():
+    collector = MetadataCollector(libp2p_host=None)
+
+    assert trio.run(collector.wait_for_connections, 1, 0.01) is False
+
+
+def test_dump_json_matches_export_data():
+    collector = MetadataCollector(libp2p_host=None)
+    collector.on_connection_opened(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound")
+    collector.on_connection_opened(PEER_B, Multiaddr("/ip4/127.0.0.1/tcp/4002"), "inbound")
+    collector.on_protocol_negotiated(PEER_B, "/ipfs/id/1.0.0")
+    collector.on_connection_closed(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"))
+
+    streamed = io.StringIO()
+    collector.dump_json(streamed)
+
+    assert json.loads(streamed.getvalue()) == json.loads(json.dumps(collector.export_data()))
+
+
+def test_conn_multiaddr_falls_back_to_raw_conn():
+    class Raw:
+        multiaddr = Multiaddr("/ip4/127.0.0.1/tcp/4003")
+
+    class Conn:
+        multiaddr = None
+        raw_conn = Raw()
+
+    assert _conn_multiaddr(Conn()) == Raw.multiaddr
+    assert _conn_multiaddr(object()) is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_export_json_matches_export_data(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(metadata_collector, "orjson", None)
+    collector = MetadataCollector(libp2p_host=None)
+    collector.on_connection_opened(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"), "outbound")
+    collector.on_connection_opened(PEER_B, Multiaddr("/ip4/127.0.0.1/tcp/4002"), "inbound")
+    collector.on_protocol_negotiated(PEER_B, "/ipfs/id/1.0.0")
+    collector.on_connection_closed(PEER_A, Multiaddr("/ip4/127.0.0.1/tcp/4001"))
+
+    exported = json.loads(collector.export_json())
+
+    assert exported == json.loads(json.dumps(collector.export_data()))
+    assert "_protocol_set" not in exported["active_connections"][0]
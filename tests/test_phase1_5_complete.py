@@ -427,6 +427,18 @@ class TestPhase15MockZKProofs:
         
         print("✓ ZK proof system validated")
 
+    def test_zk_proof_verify_batch(self):
+        """Validate batch verification returns per-proof results."""
+        zk_system = MockZKProofSystem()
+
+        valid = zk_system.generate_range_proof("bytes", 0, 10, actual_value=5)
+        invalid = zk_system.generate_unlinkability_proof(
+            "session_a", "session_b", are_unlinkable=False
+        )
+
+        assert zk_system.verify_batch([valid, invalid]) == [True, False]
+        assert zk_system.verify_batch([]) == []
+
 
 def run_all_phase15_tests():
     """
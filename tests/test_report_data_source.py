@@ -2,6 +2,7 @@
 Tests for report data source labeling.
 """
 
+import io
 import json
 
 from libp2p_privacy_poc.privacy_analyzer import PrivacyReport
@@ -44,3 +45,48 @@ def test_html_report_includes_data_source():
 
     assert "Data Source:" in html_report
     assert "SIMULATED" in html_report
+
+
+def test_risk_level_thresholds():
+    expected = {
+        0.0: "LOW",
+        0.24: "LOW",
+        0.25: "MEDIUM",
+        0.5: "HIGH",
+        0.74: "HIGH",
+        0.75: "CRITICAL",
+        1.0: "CRITICAL",
+    }
+    for score, level in expected.items():
+        report = PrivacyReport(timestamp=0.0, overall_risk_score=score)
+        assert report.get_risk_level() == level
+
+
+def test_stream_json_report_matches_generated_json():
+    report = PrivacyReport(timestamp=0.0, overall_risk_score=0.3)
+    report_gen = ReportGenerator()
+    buffer = io.StringIO()
+
+    report_gen.stream_json_report(buffer, report, data_source="REAL")
+
+    assert buffer.getvalue() == report_gen.generate_json_report(
+        report,
+        data_source="REAL",
+    )
+
+
+def test_streamed_console_and_html_reports_match_rendered():
+    report = PrivacyReport(timestamp=0.0, overall_risk_score=0.4)
+    report.recommendations = ["Rotate peer IDs"]
+    report_gen = ReportGenerator()
+    options = {"data_source": "SIMULATED", "real_zk_proof": {"verified": True}}
+
+    console = io.StringIO()
+    report_gen.stream_console_report(console, report, verbose=True, **options)
+    assert console.getvalue() == report_gen.generate_console_report(
+        report, verbose=True, **options
+    )
+
+    html = io.StringIO()
+    report_gen.stream_html_report(html, report, **options)
+    assert html.getvalue() == report_gen.generate_html_report(report, **options)